@@ -44,12 +44,21 @@ SUSPICIOUS_PATTERNS = [
     ("developer-mode", re.compile(r"(enter|enable|activate)\s+developer\s+mode", re.I)),
 ]
 
+# Single-pass prefilter: matches iff at least one pattern above matches,
+# so clean text (the common case) costs one scan instead of one per pattern.
+_ANY_SUSPICIOUS = re.compile(
+    "|".join(f"(?:{pattern.pattern})" for _, pattern in SUSPICIOUS_PATTERNS),
+    re.I,
+)
+
 BOUNDARY_START = "<<<EXTERNAL_UNTRUSTED_CONTENT>>>"
 BOUNDARY_END = "<<<END_EXTERNAL_UNTRUSTED_CONTENT>>>"
 
 
 def detect_suspicious(text: str) -> list[str]:
     """Check text for prompt injection patterns. Returns list of matched pattern names."""
+    if not _ANY_SUSPICIOUS.search(text):
+        return []
     return [name for name, pattern in SUSPICIOUS_PATTERNS if pattern.search(text)]
 
 
@@ -3,10 +3,34 @@
 
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
-
-
-@dataclass
+from typing import NamedTuple
+
+# Episode lines that matter to the parser: leading whitespace, then a
+# structural marker (group 1) and the rest of the line (group 2). The
+# markers are grouped by first character so each line start is
+# rejected or routed after one character test.
+_STRUCTURE_LINE_RE = re.compile(
+    r"^[^\S\n]*(- |#{1,3} |```|\*\*(?:Level|Duration):\*\*)([^\n]*)",
+    re.MULTILINE,
+)
+_FENCE_LINE_RE = re.compile(r"^[^\S\n]*```[^\n]*", re.MULTILINE)
+_DIGITS_RE = re.compile(r"(\d+)")
+_EM_DASH_RE = re.compile(r" -- |--")
+_SECTION_NUMBER_RE = re.compile(r"(\d+)\.\s*")
+_SECTION_TIME_RE = re.compile(r"\((\d+)\s*min\)")
+# Markdown stripped from bullets for narration: **bold**, `code`, dashes
+_CLEAN_RE = re.compile(r"\*\*(.+?)\*\*|`(.+?)`| -- |--")
+# "Key Term -- rest" or "Key Term: rest" (1-3 capitalized words)
+_LEADING_TERM_RE = re.compile(r"^([A-Z][A-Za-z.]+(?:\s+[A-Za-z.]+){0,2})\s*(--|:)\s*")
+# Bold, inline code, or bare URLs (domain.tld/path patterns)
+_BULLET_PART_RE = re.compile(
+    r"(\*\*(.+?)\*\*|`(.+?)`|\b((?:https?://|[a-z0-9-]+\.(?:com|org|net|io|dev|sh|co))\S*))"
+)
+
+
+@dataclass(slots=True)
 class EpisodeSection:
     number: int
     title: str
@@ -16,7 +40,7 @@ class EpisodeSection:
     code_language: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Episode:
     title: str
     level: str
@@ -28,8 +52,6 @@ class Episode:
 
 def parse_episode(markdown: str) -> Episode:
     """Parse an episode markdown template into an Episode object."""
-    lines = markdown.split("\n")
-
     title = ""
     level = ""
     duration_min = 30
@@ -40,86 +62,91 @@ def parse_episode(markdown: str) -> Episode:
     # State machine
     current_zone = "header"  # header | outline | takeaways | engagement
     current_section: EpisodeSection | None = None
-    in_code_block = False
-    code_lines: list[str] = []
-    code_lang: str | None = None
 
-    for line in lines:
-        stripped = line.strip()
-
-        # Inside a fenced code block — only look for closing fence
-        if in_code_block:
-            if stripped.startswith("```"):
-                in_code_block = False
+    # Only lines starting with a structural marker are visited; fenced
+    # code is consumed in one slice up to its closing fence.
+    pos = 0
+    end = len(markdown)
+    while pos <= end and (m := _STRUCTURE_LINE_RE.search(markdown, pos)):
+        marker, rest = m.group(1, 2)
+        pos = m.end() + 1
+        rest = rest.rstrip()  # the only strip; branches lstrip if they need to
+
+        # Markers are tested most frequent first: bullets, then headings
+
+        # Bullets in sections, key takeaways, engagement points
+        if marker == "- ":
+            if not rest:
+                continue
+            if current_zone == "outline":
                 if current_section:
-                    current_section.code_block = "\n".join(code_lines)
-                    current_section.code_language = code_lang
-            else:
-                code_lines.append(line.rstrip())
-            continue
-
-        # Episode title
-        if stripped.startswith("# ") and not stripped.startswith("## "):
-            title = stripped[2:].strip()
-            continue
-
-        # Metadata
-        if stripped.startswith("**Level:**"):
-            level = stripped.replace("**Level:**", "").strip()
-            continue
-        if stripped.startswith("**Duration:**"):
-            m = re.search(r"(\d+)", stripped)
-            if m:
-                duration_min = int(m.group(1))
-            continue
-        if stripped.startswith("**Prerequisites:**"):
-            continue
-
-        # Zone transitions
-        if stripped == "## Outline":
-            current_zone = "outline"
-            continue
-        if stripped == "## Key Takeaways":
-            _flush_section(current_section, sections, code_lines, code_lang)
-            current_section = None
-            current_zone = "takeaways"
-            continue
-        if stripped.startswith("## Chat Engagement"):
-            current_zone = "engagement"
+                    current_section.bullets.append(_add_oxford_comma(rest))
+            elif current_zone == "takeaways":
+                key_takeaways.append(rest)
+            elif current_zone == "engagement":
+                engagement_points.append(rest)
             continue
 
         # Outline: section headings
-        if current_zone == "outline" and stripped.startswith("### "):
-            _flush_section(current_section, sections, code_lines, code_lang)
-            code_lines = []
-            code_lang = None
-            current_section = _parse_section_heading(stripped)
+        if marker == "### ":
+            if rest and current_zone == "outline":
+                if current_section is not None:
+                    sections.append(current_section)
+                current_section = _parse_section_heading(marker + rest)
             continue
 
         # Code block opening fence
-        if current_zone == "outline" and current_section and stripped.startswith("```"):
-            in_code_block = True
-            code_lang = stripped[3:].strip() or None
-            code_lines = []
+        if marker == "```":
+            if current_zone == "outline" and current_section:
+                code_lang = rest.lstrip() or None
+                close = _FENCE_LINE_RE.search(markdown, pos) if pos <= end else None
+                if close is None:
+                    # Unclosed: the rest of the file is code
+                    body = markdown[pos:].split("\n") if pos <= end else []
+                else:
+                    body = markdown[pos:close.start() - 1].split("\n") if close.start() > pos else []
+                code_lines = [line.rstrip() for line in body]
+                if close is None:
+                    # An earlier closed block in this section wins
+                    if code_lines and current_section.code_block is None:
+                        current_section.code_block = "\n".join(code_lines)
+                        current_section.code_language = code_lang
+                    break
+                current_section.code_block = "\n".join(code_lines)
+                current_section.code_language = code_lang
+                pos = close.end() + 1
             continue
 
-        # Bullets in sections
-        if current_zone == "outline" and current_section and stripped.startswith("- "):
-            current_section.bullets.append(_add_oxford_comma(stripped[2:]))
+        # Zone transitions
+        if marker == "## ":
+            if rest == "Outline":
+                current_zone = "outline"
+            elif rest == "Key Takeaways":
+                if current_section is not None:
+                    sections.append(current_section)
+                current_section = None
+                current_zone = "takeaways"
+            elif rest.startswith("Chat Engagement"):
+                current_zone = "engagement"
             continue
 
-        # Key takeaways
-        if current_zone == "takeaways" and stripped.startswith("- "):
-            key_takeaways.append(stripped[2:])
+        # Episode title
+        if marker == "# ":
+            if rest:
+                title = rest.lstrip()
             continue
 
-        # Engagement points
-        if current_zone == "engagement" and stripped.startswith("- "):
-            engagement_points.append(stripped[2:])
-            continue
+        # Metadata
+        if marker == "**Level:**":
+            level = rest.replace("**Level:**", "").strip()
+        else:  # **Duration:**
+            dm = _DIGITS_RE.search(rest)
+            if dm:
+                duration_min = int(dm.group(1))
 
     # Flush final section
-    _flush_section(current_section, sections, code_lines, code_lang)
+    if current_section is not None:
+        sections.append(current_section)
 
     return Episode(
         title=title,
@@ -131,56 +158,63 @@ def parse_episode(markdown: str) -> Episode:
     )
 
 
-def _flush_section(
-    section: EpisodeSection | None,
-    sections: list[EpisodeSection],
-    code_lines: list[str],
-    code_lang: str | None,
-) -> None:
-    if section is None:
-        return
-    if code_lines and section.code_block is None:
-        section.code_block = "\n".join(code_lines)
-        section.code_language = code_lang
-    sections.append(section)
-
-
 def _parse_section_heading(line: str) -> EpisodeSection:
     """Parse '### 1. Why Docker? (5 min)' into an EpisodeSection."""
     text = line.lstrip("#").strip()
     # Extract number
-    num_match = re.match(r"(\d+)\.\s*", text)
+    num_match = _SECTION_NUMBER_RE.match(text)
     number = int(num_match.group(1)) if num_match else 1
     if num_match:
         text = text[num_match.end():]
     # Extract time
-    time_match = re.search(r"\((\d+)\s*min\)", text)
+    time_match = _SECTION_TIME_RE.search(text)
     time_min = int(time_match.group(1)) if time_match else 5
     if time_match:
         text = text[:time_match.start()].strip()
     return EpisodeSection(number=number, title=text, time_min=time_min, bullets=[])
 
 
+def _list_comma_before(text: str, end: int) -> int:
+    """Index of the last ', ' (comma + any whitespace) before end, or -1."""
+    i = text.rfind(",", 0, end)
+    while i >= 0 and not text[i + 1:i + 2].isspace():
+        i = text.rfind(",", 0, i)
+    return i
+
+
+def _starts_with_word(text: str, word: str) -> bool:
+    """True if text begins with word as a whole word (like re's \\bword\\b)."""
+    if not text.startswith(word):
+        return False
+    nxt = text[len(word):len(word) + 1]
+    return not nxt or not (nxt.isalnum() or nxt == "_")
+
+
 def _add_oxford_comma(text: str) -> str:
     """Insert 'and' before the last item in comma-separated lists (3+ items)."""
-    commas = [m.start() for m in re.finditer(r',\s', text)]
-    if len(commas) < 2:
+    # Only the last two list commas matter, so scan from the right
+    last_comma = _list_comma_before(text, len(text))
+    if last_comma < 0 or _list_comma_before(text, last_comma) < 0:
         return text
-    last_comma = commas[-1]
     after = text[last_comma + 1:].lstrip()
-    if re.match(r'\b(and|or)\b', after):
+    if _starts_with_word(after, "and") or _starts_with_word(after, "or"):
         return text  # already has conjunction
     return text[:last_comma + 1] + " and" + text[last_comma + 1:]
 
 
+def _clean_markup(m: re.Match) -> str:
+    inner = m.group(1) or m.group(2)
+    if inner is None:
+        return ". "  # em dash to sentence break
+    return _CLEAN_RE.sub(_clean_markup, inner)  # bold / inline code
+
+
 def _clean_bullet(bullet: str) -> str:
     """Clean markdown formatting from a bullet for TTS narration."""
-    text = bullet
-    text = re.sub(r"\*\*(.+?)\*\*", r"\1", text)  # bold
-    text = re.sub(r"`(.+?)`", r"\1", text)  # inline code
-    text = text.replace(" -- ", ". ")  # em dash to sentence break
-    text = text.replace("--", ". ")
-    text = re.sub(r"^Analogy:\s*", "Think of it this way. ", text)
+    # Bold, inline code and dashes in one pass (markup inside is cleaned too)
+    text = _CLEAN_RE.sub(_clean_markup, bullet)
+    if text.startswith("Analogy:"):
+        text = "Think of it this way. " + text[len("Analogy:"):].lstrip()
     # Ensure bullet ends with sentence punctuation so TTS pauses between bullets
     text = text.rstrip()
     if text and text[-1] not in ".!?":
@@ -196,8 +230,10 @@ def _auto_bold_leading_term(bullet: str) -> str:
     """
     if bullet.startswith("**"):
         return bullet  # already bold
-    # "Key Term -- rest" or "Key Term: rest" (1-3 capitalized words)
-    m = re.match(r"^([A-Z][A-Za-z.]+(?:\s+[A-Za-z.]+){0,2})\s*(--|:)\s*", bullet)
+    # Cheap sieve: a term starts with an ASCII capital and needs a separator
+    if not ("A" <= bullet[:1] <= "Z") or ("--" not in bullet and ":" not in bullet):
+        return bullet
+    m = _LEADING_TERM_RE.match(bullet)
     if m:
         term = m.group(1)
         sep = m.group(2)
@@ -212,15 +248,16 @@ def parse_bullet_parts(bullet: str) -> list[dict]:
     Returns a list of dicts: [{"text": "...", "style": "text"|"bold"|"code"}, ...]
     """
     bullet = _auto_bold_leading_term(bullet)
+    # Every _BULLET_PART_RE match needs one of these; plain prose skips the scan
+    if "**" not in bullet and "`" not in bullet and "." not in bullet and "://" not in bullet:
+        return [{"text": _EM_DASH_RE.sub("\u2014", bullet), "style": "text"}]
     parts: list[dict] = []
-    # Match bold, inline code, or bare URLs (domain.tld/path patterns)
-    pattern = r"(\*\*(.+?)\*\*|`(.+?)`|\b((?:https?://|[a-z0-9-]+\.(?:com|org|net|io|dev|sh|co))\S*))"
     last_end = 0
-    for m in re.finditer(pattern, bullet):
+    for m in _BULLET_PART_RE.finditer(bullet):
         if m.start() > last_end:
             plain = bullet[last_end : m.start()]
             if plain:
-                plain = plain.replace(" -- ", "\u2014").replace("--", "\u2014")
+                plain = _EM_DASH_RE.sub("\u2014", plain)
                 parts.append({"text": plain, "style": "text"})
         if m.group(2):  # **bold**
             parts.append({"text": m.group(2), "style": "bold"})
@@ -231,75 +268,131 @@ def parse_bullet_parts(bullet: str) -> list[dict]:
         last_end = m.end()
     remaining = bullet[last_end:]
     if remaining:
-        remaining = remaining.replace(" -- ", "\u2014").replace("--", "\u2014")
+        remaining = _EM_DASH_RE.sub("\u2014", remaining)
         parts.append({"text": remaining, "style": "text"})
     return parts if parts else [{"text": bullet, "style": "text"}]
 
 
-def bullets_to_narration(section: EpisodeSection) -> str:
-    """Convert a section's title and bullets into narration text for TTS."""
+def narration_and_offsets(section: EpisodeSection) -> tuple[str, list[int]]:
+    """Build a section's TTS narration and where each bullet starts in it.
+
+    Returns (narration, offsets): the title and cleaned bullets joined
+    by spaces, and the character offset of each bullet in that string.
+    Each bullet is cleaned once for both.
+    """
     parts = [f"{section.title}."]
+    offsets: list[int] = []
+    pos = len(parts[0]) + 1  # "Title. " → title + ". " (period + space before first bullet)
     for bullet in section.bullets:
-        parts.append(_clean_bullet(bullet))
-    return " ".join(parts)
+        cleaned = _clean_bullet(bullet)
+        parts.append(cleaned)
+        offsets.append(pos)
+        pos += len(cleaned) + 1  # +1 for the " " join separator
+    return " ".join(parts), offsets
+
+
+def bullets_to_narration(section: EpisodeSection) -> str:
+    """Convert a section's title and bullets into narration text for TTS."""
+    return narration_and_offsets(section)[0]
 
 
 def get_bullet_char_offsets(section: EpisodeSection) -> list[int]:
     """Return character offsets where each bullet starts in the narration string.
 
-    Mirrors the text construction in bullets_to_narration() so offsets
-    align exactly with the TTS input text.
+    Offsets align exactly with bullets_to_narration()'s TTS input text.
     """
-    offsets: list[int] = []
-    pos = len(section.title) + 2  # "Title. " → title + ". " (period + space before first bullet)
-    for bullet in section.bullets:
-        offsets.append(pos)
-        cleaned = _clean_bullet(bullet)
-        pos += len(cleaned) + 1  # +1 for the " " join separator
-    return offsets
+    return narration_and_offsets(section)[1]
 
 
 SCHEDULE_PATH = "/home/node/clawd-twitch/schedule.md"
 
 
+class _ScheduleRow(NamedTuple):
+    """One schedule.md table row (parse_schedule() hands out dicts)."""
+    date: str
+    time: str
+    topic: str
+    series: str
+    type: str
+    status: str
+
+
+class _Schedule(NamedTuple):
+    """Parsed schedule rows plus lookup indexes built alongside them."""
+    rows: list[_ScheduleRow]
+    # Normalized topic -> position of its first row
+    topic_index: dict[str, int]
+    # Series name -> position of its last row
+    series_last: dict[str, int]
+
+
+_EMPTY_SCHEDULE = _Schedule([], {}, {})
+
+# (path, mtime_ns, size) of the last parsed schedule, and its rows
+_schedule_cache: tuple[tuple[str, int, int], _Schedule] | None = None
+
+
+def _load_indexed_schedule() -> _Schedule:
+    """Parsed and indexed schedule, re-read only when schedule.md changes."""
+    global _schedule_cache
+    try:
+        st = os.stat(SCHEDULE_PATH)
+    except OSError:
+        return _EMPTY_SCHEDULE
+    key = (SCHEDULE_PATH, st.st_mtime_ns, st.st_size)
+    if _schedule_cache is None or _schedule_cache[0] != key:
+        _schedule_cache = (key, _index_schedule(_read_schedule(SCHEDULE_PATH)))
+    return _schedule_cache[1]
+
+
+def _load_schedule() -> list[_ScheduleRow]:
+    """Parsed schedule rows, re-read only when schedule.md changes."""
+    return _load_indexed_schedule().rows
+
+
+def _index_schedule(rows: list[_ScheduleRow]) -> _Schedule:
+    topic_index: dict[str, int] = {}
+    series_last: dict[str, int] = {}
+    for i, row in enumerate(rows):
+        topic_index.setdefault(_normalize_topic(row.topic), i)
+        series_last[row.series] = i
+    return _Schedule(rows, topic_index, series_last)
+
+
 def parse_schedule() -> list[dict]:
     """Parse schedule.md into a list of episode dicts."""
-    if not os.path.exists(SCHEDULE_PATH):
-        return []
+    return [row._asdict() for row in _load_schedule()]
 
-    with open(SCHEDULE_PATH) as f:
-        lines = f.readlines()
 
+def _read_schedule(path: str) -> list[_ScheduleRow]:
+    """Read the episode rows from a schedule.md table."""
     episodes = []
     in_table = False
-    for line in lines:
-        line = line.strip()
-        if line.startswith("| Date"):
-            in_table = True
-            continue
-        if in_table and line.startswith("|---"):
-            continue
-        if in_table and line.startswith("|"):
-            parts = [p.strip() for p in line.split("|")[1:-1]]
-            if len(parts) >= 6:
-                episodes.append({
-                    "date": parts[0],
-                    "time": parts[1],
-                    "topic": parts[2],
-                    "series": parts[3],
-                    "type": parts[4],
-                    "status": parts[5],
-                })
-            elif len(parts) >= 5:
-                # Backward compat: no series column
-                episodes.append({
-                    "date": parts[0],
-                    "time": parts[1],
-                    "topic": parts[2],
-                    "series": "",
-                    "type": parts[3],
-                    "status": parts[4],
-                })
+    with open(path) as f:
+        for line in f:
+            # Trailing whitespace only lands after the last "|", which
+            # the cell split discards anyway
+            line = line.lstrip()
+            if line.startswith("| Date"):
+                in_table = True
+                continue
+            if in_table and line.startswith("|---"):
+                continue
+            if in_table and line.startswith("|"):
+                # Cells are parts[1:-1]; only the columns used are stripped
+                parts = line.split("|")
+                cells = len(parts) - 2
+                if cells >= 6:
+                    episodes.append(_ScheduleRow(
+                        parts[1].strip(), parts[2].strip(), parts[3].strip(),
+                        parts[4].strip(), parts[5].strip(), parts[6].strip(),
+                    ))
+                elif cells == 5:
+                    # Backward compat: no series column
+                    episodes.append(_ScheduleRow(
+                        parts[1].strip(), parts[2].strip(), parts[3].strip(),
+                        "", parts[4].strip(), parts[5].strip(),
+                    ))
     return episodes
 
 
@@ -317,37 +410,65 @@ def get_next_episode(current_topic: str) -> dict | None:
     Returns:
         Dict with date, time, topic, series, type, status or None.
     """
-    schedule = parse_schedule()
-    norm_current = _normalize_topic(current_topic)
-    found_current = False
-    for ep in schedule:
-        if found_current:
-            return ep
-        if _normalize_topic(ep["topic"]) == norm_current:
-            found_current = True
-    return None
+    schedule = _load_indexed_schedule()
+    i = schedule.topic_index.get(_normalize_topic(current_topic))
+    if i is None or i + 1 >= len(schedule.rows):
+        return None
+    return schedule.rows[i + 1]._asdict()
 
 
 def get_series_episodes(series: str) -> list[dict]:
     """Return all episodes in a series, ordered by date."""
-    return [ep for ep in parse_schedule() if ep.get("series") == series]
+    return [ep._asdict() for ep in _load_schedule() if ep.series == series]
 
 
 def is_last_in_series(topic: str) -> bool:
     """Check if this episode is the last in its series."""
-    schedule = parse_schedule()
+    schedule = _load_indexed_schedule()
     norm = _normalize_topic(topic)
-    current = next((ep for ep in schedule if _normalize_topic(ep["topic"]) == norm), None)
-    if not current or not current.get("series"):
+    i = schedule.topic_index.get(norm)
+    if i is None or not schedule.rows[i].series:
         return True
-    series_eps = get_series_episodes(current["series"])
-    return _normalize_topic(series_eps[-1]["topic"]) == norm
+    last = schedule.rows[schedule.series_last[schedule.rows[i].series]]
+    return _normalize_topic(last.topic) == norm
+
+
+class _SlugChars(dict):
+    """str.translate table keeping [a-z0-9-] and whitespace, dropping the rest.
+
+    Filled in per character on first sight, so later lookups stay in C.
+    """
+
+    def __missing__(self, code: int) -> int | None:
+        char = chr(code)
+        keep = char in "abcdefghijklmnopqrstuvwxyz0123456789-" or char.isspace()
+        self[code] = code if keep else None
+        return self[code]
+
+
+_SLUG_CHARS = _SlugChars()
 
 
 def topic_to_slug(topic: str) -> str:
     """Convert topic name to slug (e.g., 'Python for Beginners' -> 'python-for-beginners')."""
-    slug = re.sub(r"[^a-z0-9\s-]", "", topic.lower().replace("&", "and"))
-    return re.sub(r"\s+", "-", slug.strip())
+    slug = topic.lower().replace("&", "and").translate(_SLUG_CHARS)
+    return "-".join(slug.split())
+
+
+def _parse_file(path: str) -> Episode:
+    with open(path) as f:
+        return parse_episode(f.read())
+
+
+def parse_episode_files(paths: list[str]) -> list[Episode]:
+    """Parse several episode files, in worker processes when there is more than one.
+
+    Results are in the same order as paths.
+    """
+    if len(paths) < 2:
+        return [_parse_file(path) for path in paths]
+    with ProcessPoolExecutor(max_workers=min(len(paths), os.cpu_count() or 1)) as ex:
+        return list(ex.map(_parse_file, paths))
 
 
 if __name__ == "__main__":
@@ -355,20 +476,21 @@ if __name__ == "__main__":
     import sys
 
     if len(sys.argv) < 2:
-        print("Usage: python3 parse_episode.py <episode.md>", file=sys.stderr)
+        print("Usage: python3 parse_episode.py <episode.md> [<episode.md> ...]", file=sys.stderr)
         sys.exit(1)
 
-    with open(sys.argv[1]) as f:
-        ep = parse_episode(f.read())
-
-    print(f"Title: {ep.title}")
-    print(f"Level: {ep.level}")
-    print(f"Duration: {ep.duration_min} min")
-    print(f"Sections: {len(ep.sections)}")
-    for s in ep.sections:
-        narration = bullets_to_narration(s)
-        print(f"  {s.number}. {s.title} ({s.time_min} min) — {len(s.bullets)} bullets, "
-              f"code={'yes' if s.code_block else 'no'}")
-        print(f"     Narration ({len(narration)} chars): {narration[:100]}...")
-    print(f"Takeaways: {len(ep.key_takeaways)}")
-    print(f"Engagement: {len(ep.engagement_points)}")
+    paths = sys.argv[1:]
+    for path, ep in zip(paths, parse_episode_files(paths)):
+        if len(paths) > 1:
+            print(f"== {path}")
+        print(f"Title: {ep.title}")
+        print(f"Level: {ep.level}")
+        print(f"Duration: {ep.duration_min} min")
+        print(f"Sections: {len(ep.sections)}")
+        for s in ep.sections:
+            narration = bullets_to_narration(s)
+            print(f"  {s.number}. {s.title} ({s.time_min} min) — {len(s.bullets)} bullets, "
+                  f"code={'yes' if s.code_block else 'no'}")
+            print(f"     Narration ({len(narration)} chars): {narration[:100]}...")
+        print(f"Takeaways: {len(ep.key_takeaways)}")
+        print(f"Engagement: {len(ep.engagement_points)}")
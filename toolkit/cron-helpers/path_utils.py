@@ -1,10 +1,27 @@
 """Shared path utilities for cron helper scripts."""
 
+import functools
 import os
+import re
 
 RENDERS_DIR = "/home/node/clawd-twitch/renders"
 
 
+def _relative_to(path: str, base: str) -> str:
+    """os.path.relpath(path, base), by prefix strip when that is exact.
+
+    Render paths are normally already under the renders dir and
+    normalized, which makes relpath's normalization work redundant.
+    """
+    if base and path.startswith(base + "/"):
+        rel = path[len(base) + 1:]
+        # Exact only with no empty, "." or ".." components (or dotfiles)
+        probe = f"/{rel}/"
+        if "//" not in probe and "/." not in probe:
+            return rel
+    return os.path.relpath(path, base)
+
+
 def to_windows_path(docker_path: str, renders_dir: str = RENDERS_DIR) -> str:
     """Convert a Docker render path to a Windows-accessible path.
 
@@ -13,6 +30,29 @@ def to_windows_path(docker_path: str, renders_dir: str = RENDERS_DIR) -> str:
     """
     prefix = os.environ.get("OBS_RENDERS_WIN_PREFIX", "")
     if prefix:
-        rel_path = os.path.relpath(docker_path, renders_dir)
-        return f"{prefix.rstrip(chr(92))}\\{rel_path.replace('/', chr(92))}"
+        return _prefixed_windows_path(docker_path, renders_dir, prefix)
     return docker_path
+
+
+@functools.lru_cache(maxsize=256)
+def _prefixed_windows_path(docker_path: str, renders_dir: str, prefix: str) -> str:
+    # Keyed on the prefix too, so a changed OBS_RENDERS_WIN_PREFIX takes effect
+    rel_path = _relative_to(docker_path, renders_dir)
+    return f"{prefix.rstrip(chr(92))}\\{rel_path.replace('/', chr(92))}"
+
+
+def fuzzy_find_episode_dir(base: str, slug: str) -> str | None:
+    """Find episode directory, tolerating 'and'/'the' differences in slugs."""
+    candidate = os.path.join(base, slug)
+    if os.path.isdir(candidate):
+        return candidate
+    stripped = re.sub(r"-(?:and|the|a)-", "-", slug)
+    if stripped != slug:
+        candidate = os.path.join(base, stripped)
+        if os.path.isdir(candidate):
+            return candidate
+    if os.path.isdir(base):
+        for d in os.listdir(base):
+            if re.sub(r"-(?:and|the|a)-", "-", d) == stripped:
+                return os.path.join(base, d)
+    return None
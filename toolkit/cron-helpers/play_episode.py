@@ -13,43 +13,147 @@ Env vars:
 """
 
 import argparse
-import glob
+import atexit
+import functools
 import json
 import os
 import re
+import struct
 import subprocess
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from typing import Callable, Iterator, NamedTuple
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, "/app/toolkit/obs")
 sys.path.insert(0, "/app/toolkit/twitch")
 sys.path.insert(0, "/app/toolkit/trading")
-from trading_common import ET
 
-import obs_client
-from path_utils import RENDERS_DIR, to_windows_path
+import parse_episode
+from path_utils import RENDERS_DIR, fuzzy_find_episode_dir, to_windows_path
 from parse_episode import parse_schedule as _parse_schedule_raw
-from show_flow import _fuzzy_find_episode_dir
+
+try:
+    import av
+except ImportError:
+    av = None
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 EPISODES_JSON = "/home/node/clawd-twitch/episodes.json"
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 VIDEO_DIR = os.path.join(os.path.dirname(SCRIPT_DIR), "video")
+# This interpreter, by absolute path, so no PATH search per re-render
+BRANDING_CMD = [sys.executable, os.path.join(VIDEO_DIR, "render_episode_branding.py")]
 
 MEDIA_SOURCE = os.environ.get("OBS_MEDIA_SOURCE", "EpisodeVideo")
 PLAYBACK_SCENE = os.environ.get("OBS_PLAYBACK_SCENE", "Episode Playback")
 STREAM_KEY = os.environ.get("OBS_STREAM_KEY", "")
 
+_INTRO_DATE_RE = re.compile(r"intro-(\d{8})\.mp4")
+
+
+# Probed durations, reused by later runs: "path:mtime_ns:size" -> seconds.
+# Per-user, since a cached duration times the show's episode phase.
+DURATION_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "clawd", "play_episode_durations.json",
+)
+DURATION_CACHE_MAX = 512  # entries; the oldest are dropped first
+
+_duration_lock = threading.Lock()
+_duration_cache: dict[str, int] | None = None  # DURATION_CACHE, loaded on first use
+_duration_dirty = False  # new probes not yet written back
+
 
 def _get_video_duration(video_path: str) -> int:
-    """Get video duration in seconds via ffprobe. Returns 0 on failure."""
+    """Get video duration in seconds. Returns 0 on failure.
+
+    Successful probes are cached in DURATION_CACHE per file identity, so a
+    render is only probed again once it changes.
+    """
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return 0  # ffprobe would fail on it too
+    key = f"{video_path}:{st.st_mtime_ns}:{st.st_size}"
+    duration = _cached_duration(key)
+    if duration is None:
+        duration = _probe_duration(video_path)
+        if duration:
+            _store_duration(key, duration)
+    return duration
+
+
+def _cached_duration(key: str) -> int | None:
+    global _duration_cache
+    with _duration_lock:
+        if _duration_cache is None:
+            try:
+                with open(DURATION_CACHE) as f:
+                    loaded = json.load(f)
+                _duration_cache = loaded if isinstance(loaded, dict) else {}
+            except (OSError, ValueError):
+                _duration_cache = {}  # missing or unreadable cache: just reprobe
+        duration = _duration_cache.get(key)
+    return duration if isinstance(duration, int) else None
+
+
+def _store_duration(key: str, duration: int) -> None:
+    global _duration_dirty
+    with _duration_lock:
+        _duration_cache[key] = duration
+        while len(_duration_cache) > DURATION_CACHE_MAX:
+            del _duration_cache[next(iter(_duration_cache))]
+        _duration_dirty = True
+
+
+def _save_durations() -> None:
+    """Write new probes back to DURATION_CACHE, once per run."""
+    global _duration_dirty
+    with _duration_lock:
+        if not _duration_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(DURATION_CACHE), mode=0o700, exist_ok=True)
+            tmp = f"{DURATION_CACHE}.{os.getpid()}"
+            with open(tmp, "w") as f:
+                json.dump(_duration_cache, f)
+            os.replace(tmp, DURATION_CACHE)
+            _duration_dirty = False
+        except OSError:
+            pass
+
+
+atexit.register(_save_durations)
+
+
+def _probe_duration(video_path: str) -> int:
+    """Read the duration from the MP4 header, else with PyAV, else via ffprobe."""
+    duration = _mp4_duration(video_path)
+    if duration is not None:
+        return duration
+    if av is not None:
+        try:
+            with av.open(video_path, metadata_errors="ignore") as container:
+                if container.duration:
+                    return int(container.duration / av.time_base)
+        except Exception as e:
+            print(f"WARNING: PyAV probe failed for {video_path}: {e}", file=sys.stderr)
     try:
         result = subprocess.run(
             ["ffprobe", "-v", "quiet", "-show_entries", "format=duration",
              "-of", "default=noprint_wrappers=1:nokey=1", video_path],
             capture_output=True, text=True, timeout=30,
+            # Nothing to read from stdin; our fds are non-inheritable (PEP 446)
+            stdin=subprocess.DEVNULL, close_fds=False,
         )
         if result.returncode == 0 and result.stdout.strip():
             return int(float(result.stdout.strip()))
@@ -60,97 +164,227 @@ def _get_video_duration(video_path: str) -> int:
 
 def _topic_to_slug(topic: str) -> str:
     """Convert episode topic to filesystem slug."""
-    return re.sub(r"\s+", "-", re.sub(r"[^a-z0-9\s-]", "", topic.lower().replace("&", "and")).strip())
+    return parse_episode.topic_to_slug(topic)
+
+
+def _mp4_duration(video_path: str) -> int | None:
+    """Whole seconds from the moov/mvhd box (ISO/IEC 14496-12), or None if absent.
+
+    A few small reads at the start of the file (faststart renders) or at
+    the end, instead of starting a demuxer or an ffprobe process.
+    """
+    try:
+        with open(video_path, "rb") as f:
+            end = os.fstat(f.fileno()).st_size
+            # Top-level boxes until moov, then moov's children until mvhd
+            for wanted in (b"moov", b"mvhd"):
+                while True:
+                    start = f.tell()
+                    size, kind = struct.unpack(">I4s", f.read(8))
+                    header = 8
+                    if size == 1:  # 64-bit largesize follows
+                        (size,) = struct.unpack(">Q", f.read(8))
+                        header = 16
+                    elif size == 0:  # box runs to the end of its parent
+                        size = end - start
+                    if size < header or start + size > end:
+                        return None
+                    if kind == wanted:
+                        end = start + size
+                        break
+                    f.seek(start + size)
+            version = f.read(4)[0]  # then 3 bytes of flags
+            if version == 1:
+                _, _, timescale, duration = struct.unpack(">QQIQ", f.read(28))
+            else:
+                _, _, timescale, duration = struct.unpack(">IIII", f.read(16))
+    except (OSError, IndexError, struct.error):
+        return None
+    # Fragmented MP4s leave the duration 0 (or all ones); let a demuxer sum it
+    if not timescale or not duration or duration in (0xFFFFFFFF, 0xFFFFFFFFFFFFFFFF):
+        return None
+    return duration // timescale
+
+# (path, mtime_ns, size) of schedule.md when last parsed, its slugged rows,
+# and slug -> first row with that slug
+_schedule_cache: tuple[tuple[str, int, int], list[dict], dict[str, dict]] | None = None
+
+
+def _load_schedule() -> tuple[list[dict], dict[str, dict]]:
+    """Slugged schedule rows and their slug index, re-read only when schedule.md changes."""
+    global _schedule_cache
+    path = parse_episode.SCHEDULE_PATH
+    try:
+        st = os.stat(path)
+    except OSError:
+        return [], {}
+    key = (path, st.st_mtime_ns, st.st_size)
+    if _schedule_cache is None or _schedule_cache[0] != key:
+        rows = _parse_schedule_raw()
+        by_slug: dict[str, dict] = {}
+        for row in rows:
+            row["status"] = row.get("status", "").lower()
+            row["slug"] = _topic_to_slug(row.get("topic", ""))
+            by_slug.setdefault(row["slug"], row)
+        _schedule_cache = (key, rows, by_slug)
+    return _schedule_cache[1], _schedule_cache[2]
 
 
 def parse_schedule() -> list[dict]:
-    """Parse schedule.md into a list of episode dicts with slugs."""
-    rows = _parse_schedule_raw()
-    for row in rows:
-        row["status"] = row.get("status", "").lower()
-        row["slug"] = _topic_to_slug(row.get("topic", ""))
-    return rows
-
-
-def find_series_episodes() -> list[str]:
-    """Find all episode slugs in today's scheduled series, in order."""
-    rows = parse_schedule()
-    today = datetime.now(ET).strftime("%Y-%m-%d")
+    """Parse schedule.md into a list of episode dicts with slugs.
+
+    Rows are cached until schedule.md changes, so callers must not mutate them.
+    """
+    return _load_schedule()[0]
+
+
+def _schedule_row_for_slug(slug: str) -> dict | None:
+    """First schedule row whose topic slugifies to slug, or None."""
+    return _load_schedule()[1].get(slug)
+
+
+def _find_row(predicate: Callable[[dict], bool]) -> dict | None:
+    """First schedule row matching predicate, or None."""
+    return next((row for row in parse_schedule() if predicate(row)), None)
+
+
+def _today() -> str:
+    """Today's date (ET) as used in schedule.md."""
+    from trading_common import ET
+
+    return datetime.now(ET).strftime("%Y-%m-%d")
+
+
+def _find_todays_row(today: str) -> dict | None:
+    """Today's first scheduled row, or None."""
+    return _find_row(lambda r: r["date"] == today)
+
+
+def find_series_episodes(today: str, today_row: dict | None = None) -> list[str]:
+    """Find all episode slugs in today's scheduled series, in order.
+
+    today: schedule date (YYYY-MM-DD) to look up.
+    today_row: today's first schedule row, if the caller already looked it up.
+    """
     print(f"[diag] Series lookup date: {today}")
 
     # Find today's series
-    today_series = None
-    for row in rows:
-        if row["date"] == today:
-            today_series = row["series"]
-            break
+    row = today_row or _find_row(lambda r: r["date"] == today)
+    today_series = row["series"] if row else None
 
     if not today_series:
         print(f"ERROR: No episode scheduled for {today}", file=sys.stderr)
         sys.exit(1)
 
     # Return only today's episodes in that series (not the whole series across dates)
-    episodes = [row["slug"] for row in rows if row["series"] == today_series and row["date"] == today]
+    episodes = [row["slug"] for row in parse_schedule() if row["series"] == today_series and row["date"] == today]
     print(f"Series '{today_series}': {len(episodes)} episodes")
     for i, ep in enumerate(episodes, 1):
         print(f"  {i}. {ep}")
     return episodes
 
 
-def find_episode_video(episode_name: str) -> tuple[str, int]:
-    """Find the most recent render for an episode. Returns (video_path, duration_sec)."""
-    slug = re.sub(r"\s+", "-", re.sub(r"[^a-z0-9\s-]", "", episode_name.lower().replace("&", "and")).strip())
-
-    # Check topic folder first (renders/{series}/{slug}/)
-    for series_dir in sorted(glob.glob(os.path.join(RENDERS_DIR, "*", slug))):
-        if os.path.isdir(series_dir):
-            pattern = os.path.join(series_dir, "content-*.mp4")
-            matches = sorted(glob.glob(pattern))
-            if matches:
-                video_path = matches[-1]
-                return video_path, _get_video_duration(video_path)
-
-    # Check flat episode subdirectory (legacy)
-    episode_dir = os.path.join(RENDERS_DIR, slug)
-    if os.path.isdir(episode_dir):
-        pattern = os.path.join(episode_dir, "content-*.mp4")
-        matches = sorted(glob.glob(pattern))
-        if matches:
-            video_path = matches[-1]
-            return video_path, _get_video_duration(video_path)
+def _series_dirs() -> tuple[str, ...]:
+    """Sorted non-hidden subdirectories of RENDERS_DIR."""
+    try:
+        mtime_ns = os.stat(RENDERS_DIR).st_mtime_ns
+    except OSError:
+        return ()
+    return _scan_series_dirs(RENDERS_DIR, mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_series_dirs(renders_dir: str, mtime_ns: int) -> tuple[str, ...]:
+    """_series_dirs() listing; the mtime keys the cache so new series are seen."""
+    try:
+        with os.scandir(renders_dir) as it:
+            return tuple(sorted(e.path for e in it if not e.name.startswith(".") and e.is_dir()))
+    except OSError:
+        return ()
+
+
+def _latest_render(directory: str, prefix: str) -> str | None:
+    """Path of the lexically last {prefix}*.mp4 in directory, or None.
+
+    Also None when directory is missing or not a directory.
+    """
+    try:
+        with os.scandir(directory) as it:
+            name = max((e.name for e in it if e.name.startswith(prefix) and e.name.endswith(".mp4")),
+                       default=None)
+    except OSError:
+        return None
+    return os.path.join(directory, name) if name else None
+
+
+# (base dir, slug) -> fuzzy_find_episode_dir result, for the life of the process
+_fuzzy_cache: dict[tuple[str, str], str | None] = {}
+
+
+def _fuzzy_match(base: str, slug: str) -> str | None:
+    key = (base, slug)
+    if key not in _fuzzy_cache:
+        _fuzzy_cache[key] = fuzzy_find_episode_dir(base, slug)
+    return _fuzzy_cache[key]
+
+
+def _candidate_dirs(slug: str) -> Iterator[str]:
+    """Yield directories that may hold an episode's renders, best match first.
+
+    Lazy, so the fuzzy scans only run once every exact location has missed.
+    Exact locations are yielded unchecked; _latest_render's scandir already
+    fails on a path that isn't a directory.
+    """
+    series_dirs = _series_dirs()
+
+    # Topic folder (renders/{series}/{slug}/)
+    yield from sorted(os.path.join(d, slug) for d in series_dirs)
+
+    # Flat episode subdirectory (legacy)
+    yield os.path.join(RENDERS_DIR, slug)
 
     # Fuzzy fallback: tolerate 'and'/'the' differences in slug
-    for series_base in sorted(glob.glob(os.path.join(RENDERS_DIR, "*"))):
-        if not os.path.isdir(series_base):
-            continue
-        match = _fuzzy_find_episode_dir(series_base, slug)
+    for series_base in series_dirs:
+        match = _fuzzy_match(series_base, slug)
         if match:
-            hits = sorted(glob.glob(os.path.join(match, "content-*.mp4")))
-            if hits:
-                video_path = hits[-1]
-                return video_path, _get_video_duration(video_path)
-    match = _fuzzy_find_episode_dir(RENDERS_DIR, slug)
+            yield match
+    match = _fuzzy_match(RENDERS_DIR, slug)
     if match:
-        hits = sorted(glob.glob(os.path.join(match, "content-*.mp4")))
-        if hits:
-            video_path = hits[-1]
-            return video_path, _get_video_duration(video_path)
+        yield match
+
+
+def find_episode_video(episode_name: str) -> tuple[str, int]:
+    """Find the most recent render for an episode. Returns (video_path, duration_sec)."""
+    return find_episode_video_by_slug(_topic_to_slug(episode_name))
+
+
+def find_episode_video_by_slug(slug: str) -> tuple[str, int]:
+    """find_episode_video() for a name that is already a slug (e.g. from the schedule)."""
+    video_path, duration_sec = _locate_episode_video(slug)
+    if duration_sec is None:
+        duration_sec = _get_video_duration(video_path)
+    return video_path, duration_sec
+
+
+def _locate_episode_video(slug: str) -> tuple[str, int | None]:
+    """Most recent render for a slug; duration is None if it still needs probing."""
+    for episode_dir in _candidate_dirs(slug):
+        video_path = _latest_render(episode_dir, "content-")
+        if video_path:
+            return video_path, None
 
     # Fall back to episodes.json registry (legacy)
     if not os.path.isfile(EPISODES_JSON):
         print(f"ERROR: {EPISODES_JSON} not found", file=sys.stderr)
         sys.exit(1)
 
-    with open(EPISODES_JSON) as f:
-        data = json.load(f)
+    st = os.stat(EPISODES_JSON)
+    registry = _load_registry(EPISODES_JSON, st.st_mtime_ns, st.st_size)
 
-    matches = [
-        ep for ep in data.get("episodes", [])
-        if slug in ep.get("id", "") or slug in ep.get("templateFile", "")
-    ]
+    matches = [ep for ep, keys in zip(registry.episodes, registry.match_keys) if slug in keys]
     if not matches:
-        print(f"ERROR: No rendered episode matching '{episode_name}'", file=sys.stderr)
-        available = [ep.get("id", "?") for ep in data.get("episodes", [])]
+        print(f"ERROR: No rendered episode matching '{slug}'", file=sys.stderr)
+        available = [ep.get("id", "?") for ep in registry.episodes]
         print(f"  Available: {', '.join(set(available))}", file=sys.stderr)
         sys.exit(1)
 
@@ -161,49 +395,52 @@ def find_episode_video(episode_name: str) -> tuple[str, int]:
     return video_path, best.get("durationSec", 0)
 
 
+class _Registry(NamedTuple):
+    episodes: list[dict]
+    # Per episode "id\ntemplateFile": one substring test matches either
+    # field, and a slug never contains the newline to straddle them
+    match_keys: list[str]
+
+
+@functools.lru_cache(maxsize=1)
+def _load_registry(path: str, mtime_ns: int, size: int) -> _Registry:
+    """Parsed episodes.json; the stat fields key the cache so edits are seen."""
+    with open(path, "rb") as f:
+        episodes = _json_loads(f.read()).get("episodes", [])
+    return _Registry(
+        episodes,
+        [f"{ep.get('id', '')}\n{ep.get('templateFile', '')}" for ep in episodes],
+    )
+
+
 def _get_scheduled_date(slug: str) -> str | None:
     """Get the scheduled air date for an episode slug from schedule.md."""
-    rows = parse_schedule()
-    for row in rows:
-        row_slug = re.sub(r"\s+", "-", re.sub(r"[^a-z0-9\s-]", "", row["topic"].lower().replace("&", "and")).strip())
-        if row_slug == slug:
-            return row["date"]  # e.g. "2026-02-23"
-    return None
+    row = _schedule_row_for_slug(slug)
+    return row["date"] if row else None  # e.g. "2026-02-23"
 
 
 def _get_branding_date(slug: str) -> str | None:
     """Extract the date slug from existing branding files (intro-YYYYMMDD.mp4)."""
-    for series_dir in sorted(glob.glob(os.path.join(RENDERS_DIR, "*", slug))):
-        if os.path.isdir(series_dir):
-            intros = sorted(glob.glob(os.path.join(series_dir, "intro-*.mp4")))
-            if intros:
-                # intro-20260211.mp4 → 20260211
-                base = os.path.basename(intros[-1])
-                date_part = base.replace("intro-", "").replace(".mp4", "")
-                return date_part
-    flat_dir = os.path.join(RENDERS_DIR, slug)
-    if os.path.isdir(flat_dir):
-        intros = sorted(glob.glob(os.path.join(flat_dir, "intro-*.mp4")))
-        if intros:
-            base = os.path.basename(intros[-1])
-            date_part = base.replace("intro-", "").replace(".mp4", "")
-            return date_part
-    return None
+    for series_dir in sorted(os.path.join(d, slug) for d in _series_dirs()):
+        intro = _latest_render(series_dir, "intro-")
+        if intro:
+            return _intro_date(intro)
+    # Flat episode subdirectory (legacy)
+    intro = _latest_render(os.path.join(RENDERS_DIR, slug), "intro-")
+    return _intro_date(intro) if intro else None
+
+
+def _intro_date(intro_path: str) -> str | None:
+    """intro-20260211.mp4 → 20260211; None if the name isn't in that format."""
+    m = _INTRO_DATE_RE.fullmatch(os.path.basename(intro_path))
+    return m.group(1) if m else None
 
 
 def _rerender_branding(slug: str, scheduled_date: str) -> None:
     """Re-render branding suite (intro, card, outro) with correct date."""
-    from parse_episode import parse_schedule as _parse_sched, _normalize_topic, get_next_episode, is_last_in_series
+    from parse_episode import get_next_episode, is_last_in_series
 
-    schedule = _parse_sched()
-    row = next((ep for ep in schedule if _normalize_topic(ep["topic"]) == _normalize_topic(slug.replace("-", " "))), None)
-    if not row:
-        # Try with 'and' expanded
-        for ep in schedule:
-            ep_slug = re.sub(r"\s+", "-", re.sub(r"[^a-z0-9\s-]", "", ep["topic"].lower().replace("&", "and")).strip())
-            if ep_slug == slug:
-                row = ep
-                break
+    row = _schedule_row_for_slug(slug)
     if not row:
         print(f"  WARNING: Cannot find schedule entry for {slug}, skipping re-render", file=sys.stderr)
         return
@@ -214,7 +451,7 @@ def _rerender_branding(slug: str, scheduled_date: str) -> None:
     last_in = is_last_in_series(title)
 
     branding_cmd = [
-        "python3", os.path.join(VIDEO_DIR, "render_episode_branding.py"),
+        *BRANDING_CMD,
         "--episode", slug,
         "--title", title,
         "--topic", title,
@@ -232,7 +469,7 @@ def _rerender_branding(slug: str, scheduled_date: str) -> None:
 
     print(f"  Re-rendering branding for {slug} (date: {scheduled_date}) ...")
     try:
-        subprocess.run(branding_cmd, check=True, timeout=600)
+        subprocess.run(branding_cmd, check=True, timeout=600, close_fds=False)
         print(f"  Branding re-rendered for {slug}")
     except Exception as e:
         print(f"  WARNING: Branding re-render failed: {e}", file=sys.stderr)
@@ -242,12 +479,16 @@ def ensure_branding_current(slugs: list[str]) -> None:
     """Check all episode slugs have branding with the correct scheduled date.
     Re-renders branding if the date is stale (e.g., episode was rescheduled).
     """
-    for slug in slugs:
-        sched_date = _get_scheduled_date(slug)
-        if not sched_date:
-            continue
+    scheduled = [(slug, sched_date) for slug in slugs if (sched_date := _get_scheduled_date(slug))]
+    if not scheduled:
+        return
+    # The render-dir scans are stat-bound, so run them side by side;
+    # re-renders still happen one at a time, in order
+    with ThreadPoolExecutor(max_workers=min(len(scheduled), 8)) as ex:
+        branding_dates = list(ex.map(_get_branding_date, [slug for slug, _ in scheduled]))
+
+    for (slug, sched_date), actual_date_slug in zip(scheduled, branding_dates):
         expected_date_slug = sched_date.replace("-", "")  # "2026-02-23" → "20260223"
-        actual_date_slug = _get_branding_date(slug)
         if actual_date_slug and actual_date_slug != expected_date_slug:
             print(f"  Stale branding for {slug}: have {actual_date_slug}, need {expected_date_slug}")
             _rerender_branding(slug, sched_date)
@@ -256,35 +497,44 @@ def ensure_branding_current(slugs: list[str]) -> None:
             _rerender_branding(slug, sched_date)
 
 
-def find_scheduled_episode() -> str:
-    """Find today's first scheduled episode from schedule.md."""
-    rows = parse_schedule()
-    today = datetime.now(ET).strftime("%Y-%m-%d")
+def find_scheduled_episode(today: str, today_row: dict | None = None) -> str:
+    """Find today's first scheduled episode from schedule.md.
+
+    today: schedule date (YYYY-MM-DD) to look up.
+    today_row: today's first schedule row, if the caller already looked it up.
+    """
     print(f"[diag] Schedule lookup date: {today}")
-    for row in rows:
-        if row["date"] == today:
-            print(f"[diag] Selected: {row['slug']} (series={row['series']}, status={row['status']})")
-            return row["slug"]
+    row = today_row or _find_row(lambda r: r["date"] == today)
+    if row:
+        print(f"[diag] Selected: {row['slug']} (series={row['series']}, status={row['status']})")
+        return row["slug"]
     print(f"ERROR: No episode scheduled for {today}", file=sys.stderr)
     sys.exit(1)
 
 
 def play(episode_name: str, stream: bool = True) -> None:
     """Orchestrate episode playback."""
+    import obs_client
+
     # 1. Find video
-    video_path, duration_sec = find_episode_video(episode_name)
+    video_path, duration_sec = _locate_episode_video(_topic_to_slug(episode_name))
     win_path = to_windows_path(video_path)
     print(f"Episode: {episode_name}")
     print(f"Video: {video_path}")
     print(f"OBS path: {win_path}")
-    print(f"Duration: {duration_sec // 60}:{duration_sec % 60:02d}")
 
-    # 2. Ensure OBS is running
-    print("\nLaunching OBS ...")
-    if not obs_client.launch_obs():
-        print("ERROR: Could not launch OBS", file=sys.stderr)
-        sys.exit(1)
-    print("OBS connected")
+    # 2. Ensure OBS is running, probing the video's duration meanwhile
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        probe = ex.submit(_get_video_duration, video_path) if duration_sec is None else None
+        print("\nLaunching OBS ...")
+        if not obs_client.launch_obs():
+            print("ERROR: Could not launch OBS", file=sys.stderr)
+            sys.exit(1)
+        print("OBS connected")
+        if probe:
+            duration_sec = probe.result()
+    dur_min, dur_s = divmod(duration_sec, 60)
+    print(f"Duration: {dur_min}:{dur_s:02d}")
 
     # 3. Ensure playback scene exists, switch to it, load video
     print(f"Setting up scene: {PLAYBACK_SCENE}")
@@ -296,7 +546,9 @@ def play(episode_name: str, stream: bool = True) -> None:
     obs_client.set_input_volume(MEDIA_SOURCE, 0.0)  # normalized at render time
     time.sleep(1)
 
-    # 4. Start playback
+    # 4. Start playback (listen for its end first so the event can't be missed)
+    ended = threading.Event()
+    listening = obs_client.arm_media_end_wait(MEDIA_SOURCE, ended)
     obs_client.trigger_media_action(
         MEDIA_SOURCE, "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART",
     )
@@ -325,34 +577,46 @@ def play(episode_name: str, stream: bool = True) -> None:
     # If ffprobe failed (duration=0), use a generous fallback
     effective_timeout = max(duration_sec, 3600) + 60
     print(f"\nWaiting for video to finish (timeout: {effective_timeout}s) ...")
-    poll_interval = 10
+    # With events the end is signalled and polling only prints progress.
+    # Without, the interval adapts to the time left (see below).
+    poll_interval = 60 if listening else 10
     elapsed = 0
     consecutive_errors = 0
     max_consecutive_errors = 5
 
-    while elapsed < effective_timeout:
-        time.sleep(poll_interval)
-        elapsed += poll_interval
-        try:
-            ms = obs_client.get_media_status(MEDIA_SOURCE)
-            consecutive_errors = 0
-            state = ms.get("state", "")
-            if state == "OBS_MEDIA_STATE_ENDED":
+    try:
+        while elapsed < effective_timeout:
+            if ended.wait(poll_interval):
                 print("Video finished")
                 break
-            cursor_sec = (ms.get("cursor", 0) or 0) / 1000
-            dur = (ms.get("duration", 0) or 0) / 1000
-            display_dur = dur if dur > 0 else duration_sec
-            print(f"  {int(cursor_sec // 60)}:{int(cursor_sec % 60):02d}"
-                  f" / {int(display_dur) // 60}:{int(display_dur) % 60:02d}")
-        except Exception as e:
-            consecutive_errors += 1
-            print(f"  (poll error {consecutive_errors}/{max_consecutive_errors}: {e})",
-                  file=sys.stderr)
-            if consecutive_errors >= max_consecutive_errors:
-                print(f"  ABORT: {max_consecutive_errors} consecutive poll failures",
+            elapsed += poll_interval
+            try:
+                ms = obs_client.get_media_status(MEDIA_SOURCE)
+                consecutive_errors = 0
+                state = ms.get("state", "")
+                if state == "OBS_MEDIA_STATE_ENDED":
+                    print("Video finished")
+                    break
+                cursor_sec = (ms.get("cursor", 0) or 0) / 1000
+                dur = (ms.get("duration", 0) or 0) / 1000
+                display_dur = dur if dur > 0 else duration_sec
+                cursor_min, cursor_s = divmod(int(cursor_sec), 60)
+                dur_min, dur_s = divmod(int(display_dur), 60)
+                print(f"  {cursor_min}:{cursor_s:02d} / {dur_min}:{dur_s:02d}")
+                if not listening and display_dur > 0:
+                    # Sparse polls mid-video, tightening to 2 s near the end
+                    poll_interval = max(2, min(60, int(display_dur - cursor_sec) // 4))
+            except Exception as e:
+                consecutive_errors += 1
+                print(f"  (poll error {consecutive_errors}/{max_consecutive_errors}: {e})",
                       file=sys.stderr)
-                break
+                if consecutive_errors >= max_consecutive_errors:
+                    print(f"  ABORT: {max_consecutive_errors} consecutive poll failures",
+                          file=sys.stderr)
+                    break
+    except KeyboardInterrupt:
+        # Ctrl-C still falls through to stopping the stream below
+        print("\nInterrupted", file=sys.stderr)
 
     # 7. Stop streaming and close OBS
     if stream:
@@ -371,19 +635,19 @@ def play(episode_name: str, stream: bool = True) -> None:
     print(f"\nDone: {episode_name}")
 
 
-def _update_twitch_metadata(args: argparse.Namespace) -> None:
-    """Update Twitch channel title/category before streaming."""
+def _update_twitch_metadata(args: argparse.Namespace, today_row: dict | None = None) -> None:
+    """Update Twitch channel title/category before streaming.
+
+    today_row: today's first schedule row, if the caller already looked it up.
+    """
     title = getattr(args, "twitch_title", None)
     category = getattr(args, "twitch_category", None)
 
     # Auto-derive title from schedule when --from-schedule and no explicit --twitch-title
     if not title and getattr(args, "from_schedule", False):
-        rows = parse_schedule()
-        today = datetime.now(ET).strftime("%Y-%m-%d")
-        for row in rows:
-            if row["date"] == today:
-                title = row["topic"]
-                break
+        row = today_row or _find_todays_row(_today())
+        if row:
+            title = row["topic"]
 
     # Default category when any Twitch flag is used
     if title and not category:
@@ -418,30 +682,42 @@ def main() -> None:
                         help="Set Twitch game category (default: Software and Game Development)")
     args = parser.parse_args()
 
+    # Looked up once and shared by every --from-schedule step below
+    today = _today() if args.from_schedule else None
+    today_row = _find_todays_row(today) if today else None
+
     # Update Twitch channel metadata if requested
-    _update_twitch_metadata(args)
+    _update_twitch_metadata(args, today_row)
 
     if args.series and args.from_schedule:
         # Series mode: play all episodes in today's series back-to-back
-        episodes = find_series_episodes()
-
-        # Re-render branding if scheduled date changed since last render
-        ensure_branding_current(episodes)
-
-        episode_data = []
-        for slug in episodes:
-            try:
-                video_path, duration_sec = find_episode_video(slug)
-                episode_data.append((slug, video_path, duration_sec))
-            except SystemExit:
-                print(f"  SKIP: {slug} (no rendered video)")
+        episodes = find_series_episodes(today, today_row)
+
+        # Resolve and probe every video in the background while branding
+        # re-renders (minutes per stale episode); probes overlap each other
+        # too, and a slug scheduled twice is probed once
+        with ThreadPoolExecutor(max_workers=min(len(episodes), 4) or 1) as ex:
+            lookups = {slug: ex.submit(find_episode_video_by_slug, slug)
+                       for slug in dict.fromkeys(episodes)}
+            videos = [lookups[slug] for slug in episodes]
+
+            # Re-render branding if scheduled date changed since last render
+            ensure_branding_current(episodes)
+
+            episode_data = []
+            for slug, video in zip(episodes, videos):
+                try:
+                    video_path, duration_sec = video.result()
+                    episode_data.append((slug, video_path, duration_sec))
+                except SystemExit:
+                    print(f"  SKIP: {slug} (no rendered video)")
 
         import show_flow
         show_flow.run_series_show(episode_data, stream=not args.no_stream)
         return
 
     if args.from_schedule:
-        episode_name = find_scheduled_episode()
+        episode_name = find_scheduled_episode(today, today_row)
     else:
         episode_name = args.episode
 
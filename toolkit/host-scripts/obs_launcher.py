@@ -16,14 +16,17 @@ import logging.handlers
 import ntpath
 import os
 import subprocess
+import threading
 import time
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 
 DEFAULT_PORT = 8100
 DEFAULT_OBS_PATH = r"C:\Program Files\obs-studio\bin\64bit\obs64.exe"
 
 _START_TIME = time.time()
 _log = logging.getLogger("obs-launcher")
+# Handlers run on threads; launch/kill and their status reply run one at a time
+_obs_lock = threading.Lock()
 
 
 def _setup_logging(log_file: str | None) -> None:
@@ -97,12 +100,17 @@ def _kill_obs() -> bool:
 
 class Handler(BaseHTTPRequestHandler):
     obs_path = DEFAULT_OBS_PATH
+    # Keep-alive so clients can reuse one connection; drop idle ones
+    protocol_version = "HTTP/1.1"
+    timeout = 60
 
     def _respond(self, data: dict, status: int = 200) -> None:
+        body = json.dumps(data).encode()
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        self.wfile.write(body)
 
     def do_GET(self) -> None:
         if self.path == "/status":
@@ -118,11 +126,15 @@ class Handler(BaseHTTPRequestHandler):
 
     def do_POST(self) -> None:
         if self.path == "/launch":
-            ok = _launch_obs(self.obs_path)
-            self._respond({"launched": ok, "running": _is_obs_running()})
+            with _obs_lock:
+                ok = _launch_obs(self.obs_path)
+                data = {"launched": ok, "running": _is_obs_running()}
+            self._respond(data)
         elif self.path == "/kill":
-            _kill_obs()
-            self._respond({"running": _is_obs_running()})
+            with _obs_lock:
+                _kill_obs()
+                data = {"running": _is_obs_running()}
+            self._respond(data)
         else:
             self._respond({"error": "not found"}, 404)
 
@@ -141,7 +153,7 @@ def main() -> None:
     _setup_logging(args.log_file)
 
     Handler.obs_path = args.obs_path
-    server = HTTPServer(("0.0.0.0", args.port), Handler)
+    server = ThreadingHTTPServer(("0.0.0.0", args.port), Handler)
     _log.info("OBS launcher listening on :%d (PID %d)", args.port, os.getpid())
     _log.info("OBS path: %s", args.obs_path)
     _log.info("Log file: %s", args.log_file)
@@ -9,15 +9,33 @@ Env vars:
   OBS_WS_PORT      - WebSocket port (default: 4455)
   OBS_WS_PASSWORD   - WebSocket password (default: empty)
   OBS_LAUNCHER_URL  - Host launcher base URL (default: http://host.docker.internal:8100)
+  OBS_LOG_LEVEL     - CLI log level (default: WARNING)
 """
 
+import atexit
+import functools
+import http.client
+import itertools
 import json
+import logging
 import os
+import socket
 import sys
+import threading
 import time
-import urllib.request
+import urllib.parse
+from contextlib import contextmanager
+from json.encoder import encode_basestring_ascii
+from typing import TYPE_CHECKING, Callable
 
-import obsws_python as obs
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if TYPE_CHECKING:
+    import obsws_python as obs
+    from obsws_python.error import OBSSDKError, OBSSDKRequestError
 
 WS_HOST = os.environ.get("OBS_WS_HOST", "host.docker.internal")
 WS_PORT = int(os.environ.get("OBS_WS_PORT", "4455"))
@@ -25,112 +43,590 @@ WS_PASSWORD = os.environ.get("OBS_WS_PASSWORD", "")
 LAUNCHER_URL = os.environ.get("OBS_LAUNCHER_URL", "http://host.docker.internal:8100")
 TIMEOUT = 5
 
+logger = logging.getLogger(__name__)
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, indent: bool = False) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps(obj, indent: bool = False) -> str:
+        return json.dumps(obj, indent=2 if indent else None)
+
 
 # ── Launch (via host HTTP launcher) ──────────────────────────────
 
+# Kept-alive HTTP/1.1 connection to the launcher, opened on first use
+_http: http.client.HTTPConnection | None = None
+
+
+def _launcher_request(method: str, path: str) -> dict:
+    """Send a request to the host launcher and return its JSON reply.
+
+    Reuses one persistent connection; if a reused connection turns out
+    to have been closed by the launcher, retries once on a fresh one.
+    """
+    global _http
+    url = urllib.parse.urlsplit(LAUNCHER_URL)
+    while True:
+        reused = _http is not None
+        if not reused:
+            if url.scheme == "https":
+                _http = http.client.HTTPSConnection(
+                    url.hostname, url.port or 443, timeout=TIMEOUT)
+            else:
+                _http = http.client.HTTPConnection(
+                    url.hostname, url.port or 80, timeout=TIMEOUT)
+        try:
+            # Keep any base path of LAUNCHER_URL (e.g. behind a proxy)
+            _http.request(method, url.path.rstrip("/") + path)
+            resp = _http.getresponse()
+            body = resp.read()
+        except ConnectionError:
+            _http.close()
+            _http = None
+            if reused:
+                continue
+            raise
+        except Exception:
+            _http.close()
+            _http = None
+            raise
+        if resp.will_close:
+            _http.close()
+            _http = None
+        if resp.status >= 400:
+            raise RuntimeError(f"Launcher {method} {path}: HTTP {resp.status}")
+        return _json_loads(body)
+
+
+def port_open(timeout: float = 0.5) -> bool:
+    """Cheap check that something is listening on the WebSocket port."""
+    try:
+        socket.create_connection((WS_HOST, WS_PORT), timeout=timeout).close()
+        return True
+    except OSError:
+        return False
+
+
 def launch_obs(wait: bool = True, max_wait: int = 30) -> bool:
     """Ask host launcher to start OBS. Returns True if OBS is running."""
     try:
-        req = urllib.request.Request(f"{LAUNCHER_URL}/launch", method="POST")
-        resp = urllib.request.urlopen(req, timeout=TIMEOUT)
-        data = json.loads(resp.read())
+        data = _launcher_request("POST", "/launch")
         if not wait:
             return data.get("running", False)
     except Exception as e:
-        print(f"Launcher error: {e}", file=sys.stderr)
+        logger.warning("Launcher error: %s", e)
         return False
 
-    # Wait for OBS WebSocket to become reachable
-    for _ in range(max_wait):
-        if is_connected():
+    # Wait for OBS WebSocket to become reachable. Probe quickly at first
+    # (100ms, doubling up to 1s) so a fast start is noticed right away.
+    # Until the port accepts TCP connections, a full WebSocket handshake
+    # can't succeed, so only then is is_connected() tried.
+    deadline = time.monotonic() + max_wait
+    delay = 0.1
+    while True:
+        if port_open() and is_connected():
             return True
-        time.sleep(1)
-    return False
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
 
 
 def kill_obs() -> bool:
     """Ask host launcher to stop OBS."""
     try:
-        req = urllib.request.Request(f"{LAUNCHER_URL}/kill", method="POST")
-        resp = urllib.request.urlopen(req, timeout=TIMEOUT)
-        data = json.loads(resp.read())
+        data = _launcher_request("POST", "/kill")
         return not data.get("running", True)
     except Exception as e:
-        print(f"Launcher error: {e}", file=sys.stderr)
+        logger.warning("Launcher error: %s", e)
         return False
 
 
 def launcher_status() -> dict:
     """Check OBS process status via host launcher."""
     try:
-        resp = urllib.request.urlopen(f"{LAUNCHER_URL}/status", timeout=TIMEOUT)
-        return json.loads(resp.read())
+        return _launcher_request("GET", "/status")
     except Exception as e:
         return {"running": False, "error": str(e)}
 
 
+def launcher_health() -> dict:
+    """Get launcher uptime/PID (raises if /health is unavailable)."""
+    return _launcher_request("GET", "/health")
+
+
 # ── WebSocket control ────────────────────────────────────────────
 
-def _connect() -> obs.ReqClient:
+_client: "obs.ReqClient | None" = None
+_client_lock = threading.RLock()
+# Canvas (base) resolution for the current connection; reset on reconnect
+_canvas: tuple[int, int] | None = None
+# How many _session() blocks are open (all on the thread holding the lock)
+_session_depth = 0
+# Errors meaning the socket itself is gone; websocket-client's are added
+# once obsws-python is imported
+_CONNECTION_ERRORS: tuple[type[BaseException], ...] = (OSError,)
+
+
+def _obsws():
+    """Import obsws-python on first WebSocket use.
+
+    It pulls in websocket-client and ssl, which launcher-only commands
+    and the health check's HTTP path never need. Also binds the
+    OBSSDK* error names used throughout this module.
+    """
+    global obs, OBSSDKError, OBSSDKRequestError, _CONNECTION_ERRORS
+    if "obs" not in globals():
+        import obsws_python
+        from obsws_python.error import OBSSDKError, OBSSDKRequestError
+        try:
+            from websocket import WebSocketException
+            _CONNECTION_ERRORS = (OSError, WebSocketException)
+        except ImportError:
+            pass
+        obs = obsws_python
+    return obs
+
+
+def _connect() -> "obs.ReqClient":
     """Create a new OBS WebSocket connection."""
-    return obs.ReqClient(host=WS_HOST, port=WS_PORT, password=WS_PASSWORD, timeout=TIMEOUT)
+    return _obsws().ReqClient(host=WS_HOST, port=WS_PORT, password=WS_PASSWORD, timeout=TIMEOUT)
+
+
+def _close() -> None:
+    """Disconnect and forget the shared WebSocket connection."""
+    global _client, _canvas
+    with _client_lock:
+        _canvas = None
+        if _client is not None:
+            try:
+                _client.disconnect()
+            except Exception:
+                pass
+            _client = None
+
+
+atexit.register(_close)
+
+
+@contextmanager
+def _session():
+    """Yield the shared OBS WebSocket connection, connecting on first use.
+
+    The connection is reused across calls. Any failure other than OBS
+    rejecting a request drops it so the next call reconnects; only the
+    outermost session drops it, as nested ones share its client.
+    """
+    global _client, _session_depth
+    with _client_lock:
+        if _client is None:
+            _client = _connect()
+        _session_depth += 1
+        try:
+            yield _client
+        except OBSSDKRequestError:
+            raise
+        except Exception:
+            if _session_depth == 1:
+                _close()
+            raise
+        finally:
+            _session_depth -= 1
+
+
+def _reconnecting(fn: Callable[[], object]) -> object:
+    """Call fn() once more on a new connection if the reused one is dead.
+
+    The cached client goes stale when OBS restarts, and only the first
+    request on it notices. Nested calls are not retried: the outer
+    session still holds the old client.
+    """
+    with _client_lock:
+        reused = _client is not None and _session_depth == 0
+        try:
+            return fn()
+        except _CONNECTION_ERRORS:
+            if not reused:
+                raise
+        logger.info("OBS connection lost; reconnecting")
+        return fn()
+
+
+def _with_obs(fn):
+    """Run fn(cl, ...) inside _session(); callers omit the client."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        def call():
+            with _session() as cl:
+                return fn(cl, *args, **kwargs)
+        return _reconnecting(call)
+    return wrapper
+
+
+# RequestBatch execution types (obs-websocket v5 protocol)
+BATCH_SERIAL_REALTIME = 0
+BATCH_SERIAL_FRAME = 1
+BATCH_PARALLEL = 2
+
+_batch_ids = itertools.count(1)
+
+# RequestStatus codes for a missing / already existing scene, input or item
+RESOURCE_NOT_FOUND = 600
+RESOURCE_ALREADY_EXISTS = 601
+
+
+def _batch(
+    cl: "obs.ReqClient", requests: list[dict],
+    execution_type: int = BATCH_SERIAL_REALTIME,
+    halt_on_failure: bool = False, check: bool = True,
+) -> list[dict]:
+    """Send several requests in one RequestBatch frame (one round-trip).
+
+    obsws-python has no batch API, so this speaks op 8/9 on the client's
+    socket directly. Each request is {"requestType", "requestData"} plus
+    optional "outputVariables" ({var: responseField}) and
+    "inputVariables" ({requestField: var}) to pipe values between
+    requests (serial execution types only).
+
+    Returns the per-request results in order. With check=True, raises
+    OBSSDKRequestError for the first failed request.
+    """
+    ws = cl.base_client.ws
+    ws.send(_json_dumps({
+        "op": 8,
+        "d": {
+            "requestId": str(next(_batch_ids)),
+            "haltOnFailure": halt_on_failure,
+            "executionType": execution_type,
+            "requests": requests,
+        },
+    }))
+    response = _json_loads(ws.recv())
+    if response.get("op") != 9:
+        raise OBSSDKError(f"Expected RequestBatchResponse, got op {response.get('op')}")
+    results = response["d"]["results"]
+    if check:
+        for r in results:
+            status = r["requestStatus"]
+            if not status["result"]:
+                raise OBSSDKRequestError(r["requestType"], status["code"], status.get("comment"))
+    return results
 
 
 def is_connected() -> bool:
     """Check if OBS WebSocket is reachable."""
     try:
-        cl = _connect()
-        cl.get_version()
-        cl.disconnect()
+        _get_version()
         return True
     except Exception:
         return False
 
 
-def get_status() -> dict:
+@_with_obs
+def _get_version(cl: "obs.ReqClient") -> None:
+    cl.get_version()
+
+
+@_with_obs
+def get_status(cl: "obs.ReqClient") -> dict:
     """Get OBS streaming/recording status and current scene."""
-    cl = _connect()
-    try:
-        stream = cl.get_stream_status()
-        scene = cl.get_current_program_scene()
-        version = cl.get_version()
-        return {
-            "connected": True,
-            "obs_version": version.obs_version,
-            "streaming": stream.output_active,
-            "stream_duration": getattr(stream, "output_duration", 0),
-            "current_scene": scene.scene_name,
-        }
-    finally:
-        cl.disconnect()
-
-
-def get_scenes() -> list[str]:
+    stream, scene, version = (r.get("responseData", {}) for r in _batch(cl, [
+        {"requestType": "GetStreamStatus"},
+        {"requestType": "GetCurrentProgramScene"},
+        {"requestType": "GetVersion"},
+    ]))
+    return {
+        "connected": True,
+        "obs_version": version["obsVersion"],
+        "streaming": stream["outputActive"],
+        "stream_duration": stream.get("outputDuration", 0),
+        "current_scene": scene["sceneName"],
+    }
+
+
+@_with_obs
+def get_scenes(cl: "obs.ReqClient") -> list[str]:
     """List available scene names."""
-    cl = _connect()
-    try:
-        resp = cl.get_scene_list()
-        return [s["sceneName"] for s in resp.scenes]
-    finally:
-        cl.disconnect()
+    resp = cl.get_scene_list()
+    return [s["sceneName"] for s in resp.scenes]
 
 
-def switch_scene(name: str) -> None:
+@_with_obs
+def switch_scene(cl: "obs.ReqClient", name: str) -> None:
     """Switch to a named scene."""
-    cl = _connect()
-    try:
-        cl.set_current_program_scene(name)
-    finally:
-        cl.disconnect()
+    cl.set_current_program_scene(name)
 
 
-def is_streaming() -> bool:
+@_with_obs
+def is_streaming(cl: "obs.ReqClient") -> bool:
     """Check if OBS is currently streaming."""
-    cl = _connect()
+    return cl.get_stream_status().output_active
+
+
+# ── Events (separate EventClient socket) ─────────────────────────
+#
+# obsws-python keeps requests and events on separate sockets. One shared
+# EventClient, started on first need, tracks stream state and media
+# playback ends, and mirrors the scene/item inventory so setup calls can
+# skip existence probes.
+# Callbacks are dispatched by function name, hence the public on_* names.
+
+_events = None
+_stream_cond = threading.Condition()
+_stream_live: bool | None = None
+
+# Per media input, events to set when its playback next ends
+_media_lock = threading.Lock()
+_media_waiters: dict[str, list[threading.Event]] = {}
+
+_SETTLED_OUTPUT_STATES = {
+    "OBS_WEBSOCKET_OUTPUT_STARTED": True,
+    "OBS_WEBSOCKET_OUTPUT_STOPPED": False,
+}
+
+# Mirrored only while the listener runs: scene names, and per scene
+# {source name: sceneItemId}. None / missing key means "ask OBS".
+_inventory_lock = threading.Lock()
+_scenes: set[str] | None = None
+_scene_items: dict[str, dict[str, int]] = {}
+# Whether the inventory alone justifies opening the event socket. The
+# CLI turns this off: a single-shot command would pay a second socket
+# and handshake to save at most one lookup. Stream waits always start it.
+_track_inventory = True
+
+
+def on_stream_state_changed(data) -> None:
+    """EventClient callback (obsws-python dispatches on this exact name)."""
+    global _stream_live
+    live = _SETTLED_OUTPUT_STATES.get(data.output_state)
+    if live is None:
+        return  # STARTING / STOPPING / RECONNECTING
+    with _stream_cond:
+        _stream_live = live
+        _stream_cond.notify_all()
+
+
+def on_media_input_playback_ended(data) -> None:
+    with _media_lock:
+        waiters = _media_waiters.pop(data.input_name, [])
+    for ended in waiters:
+        ended.set()
+
+
+def _remember_scene(name: str) -> None:
+    with _inventory_lock:
+        if _scenes is not None:
+            _scenes.add(name)
+
+
+def _remember_item(scene: str, source: str, item_id: int) -> None:
+    with _inventory_lock:
+        items = _scene_items.get(scene)
+        if items is not None:
+            items[source] = item_id
+
+
+def on_scene_created(data) -> None:
+    _remember_scene(data.scene_name)
+
+
+def on_scene_removed(data) -> None:
+    with _inventory_lock:
+        if _scenes is not None:
+            _scenes.discard(data.scene_name)
+        _scene_items.pop(data.scene_name, None)
+
+
+def on_scene_name_changed(data) -> None:
+    with _inventory_lock:
+        if _scenes is not None:
+            _scenes.discard(data.old_scene_name)
+            _scenes.add(data.scene_name)
+        items = _scene_items.pop(data.old_scene_name, None)
+        if items is not None:
+            _scene_items[data.scene_name] = items
+
+
+def on_scene_item_created(data) -> None:
+    _remember_item(data.scene_name, data.source_name, data.scene_item_id)
+
+
+def on_scene_item_removed(data) -> None:
+    with _inventory_lock:
+        items = _scene_items.get(data.scene_name)
+        if items is not None and items.get(data.source_name) == data.scene_item_id:
+            del items[data.source_name]
+
+
+def on_input_name_changed(data) -> None:
+    with _inventory_lock:
+        for items in _scene_items.values():
+            if data.old_input_name in items:
+                items[data.input_name] = items.pop(data.old_input_name)
+
+
+def _forget_inventory() -> None:
+    global _scenes
+    with _inventory_lock:
+        _scenes = None
+        _scene_items.clear()
+
+
+def _close_events() -> None:
+    """Stop the event listener, if running."""
+    global _events
+    with _client_lock:
+        if _events is not None:
+            try:
+                _events.disconnect()
+            except Exception:
+                pass
+            _events = None
+        _forget_inventory()
+
+
+atexit.register(_close_events)
+
+
+def _event_listener(start: bool = True) -> bool:
+    """Start the shared event listener if needed. False if unavailable.
+
+    With start=False, only reports whether it is already running.
+    """
+    global _events
+    with _client_lock:
+        if _events is not None and not _events.worker.is_alive():
+            # Socket dropped (e.g. OBS restarted): mirrored state is stale
+            _events = None
+            _forget_inventory()
+        if _events is None:
+            if not start:
+                return False
+            try:
+                obs = _obsws()
+                _events = obs.EventClient(
+                    host=WS_HOST, port=WS_PORT, password=WS_PASSWORD, timeout=TIMEOUT,
+                    subs=(obs.Subs.OUTPUTS | obs.Subs.SCENES | obs.Subs.INPUTS
+                          | obs.Subs.SCENEITEMS | obs.Subs.MEDIAINPUTS),
+                )
+            except Exception:
+                return False
+            _events.callback.register([
+                on_stream_state_changed, on_scene_created, on_scene_removed,
+                on_scene_name_changed, on_scene_item_created, on_scene_item_removed,
+                on_input_name_changed, on_media_input_playback_ended,
+            ])
+    return True
+
+
+def _known_scenes(cl: "obs.ReqClient") -> set[str] | None:
+    """Scene names, listed once and then kept live by events.
+
+    Returns None when events are unavailable (state can't be trusted).
+    """
+    global _scenes
+    if not _event_listener(start=_track_inventory):
+        return None
+    with _inventory_lock:
+        if _scenes is not None:
+            return _scenes
+    names = {s["sceneName"] for s in cl.get_scene_list().scenes}
+    with _inventory_lock:
+        if _scenes is None:
+            _scenes = names
+        return _scenes
+
+
+def _known_items(cl: "obs.ReqClient", scene: str) -> dict[str, int] | None:
+    """{source: sceneItemId} for a scene, listed once, kept live by events.
+
+    Returns None when events are unavailable or the scene doesn't exist.
+    """
+    if not _event_listener(start=_track_inventory):
+        return None
+    with _inventory_lock:
+        if scene in _scene_items:
+            return _scene_items[scene]
     try:
-        return cl.get_stream_status().output_active
-    finally:
-        cl.disconnect()
+        listed = cl.get_scene_item_list(scene).scene_items
+    except OBSSDKRequestError:
+        return None
+    with _inventory_lock:
+        return _scene_items.setdefault(
+            scene, {it["sourceName"]: it["sceneItemId"] for it in listed})
+
+
+def _scene_item_id(cl: "obs.ReqClient", scene: str, source: str) -> int | None:
+    """Look up a source's sceneItemId without a failing request on a miss.
+
+    Uses the event-mirrored map, or one GetSceneItemList when events are
+    unavailable. None if the scene or the source in it doesn't exist.
+    """
+    items = _known_items(cl, scene)
+    if items is None:
+        try:
+            listed = cl.get_scene_item_list(scene).scene_items
+        except OBSSDKRequestError:
+            return None
+        items = {it["sourceName"]: it["sceneItemId"] for it in listed}
+    return items.get(source)
+
+
+def _arm_stream_wait() -> bool:
+    """Prepare to wait for a stream state change; call before start/stop.
+
+    Forgets the last seen state. Returns False if events are
+    unavailable (caller will poll).
+    """
+    global _stream_live
+    if not _event_listener():
+        return False
+    with _stream_cond:
+        _stream_live = None
+    return True
+
+
+def _wait_stream_state(live: bool, timeout: int, listening: bool) -> bool:
+    """Wait until the stream is (live=True) or isn't (live=False) active.
+
+    Returns as soon as the matching event arrives; without events, polls
+    once a second. Either way the final answer is confirmed by a query.
+    """
+    if listening:
+        with _stream_cond:
+            if _stream_cond.wait_for(lambda: _stream_live is live, timeout):
+                return True
+        try:
+            return is_streaming() is live
+        except Exception:
+            return False
+
+    for _ in range(timeout):
+        time.sleep(1)
+        try:
+            if is_streaming() is live:
+                return True
+        except Exception:
+            pass
+    return False
+
+
+def arm_media_end_wait(source: str, ended: threading.Event) -> bool:
+    """Have ended set when source's playback next ends; call before (re)starting it.
+
+    Returns False if events are unavailable (caller will poll).
+    """
+    if not _event_listener():
+        return False
+    with _media_lock:
+        _media_waiters.setdefault(source, []).append(ended)
+    return True
 
 
 def start_streaming(verify_timeout: int = 15) -> None:
@@ -142,34 +638,25 @@ def start_streaming(verify_timeout: int = 15) -> None:
     Raises:
         RuntimeError: If stream fails to start within timeout.
     """
-    cl = _connect()
-    try:
-        status = cl.get_stream_status()
-        if status.output_active:
-            print("Stream already active, stopping first...")
-            cl.stop_stream()
-            for _ in range(15):
-                time.sleep(1)
-                if not cl.get_stream_status().output_active:
-                    break
-            else:
-                raise RuntimeError("Timed out waiting for existing stream to stop")
-        cl.start_stream()
-    finally:
-        cl.disconnect()
-
-    # Verify stream actually went live (new connection — OBS needs a moment)
-    for i in range(verify_timeout):
-        time.sleep(1)
-        try:
-            cl2 = _connect()
-            try:
-                if cl2.get_stream_status().output_active:
-                    return
-            finally:
-                cl2.disconnect()
-        except Exception:
-            pass
+    def request_start() -> bool:
+        # Starts from a status query, so safe to rerun on a new connection
+        with _session() as cl:
+            status = cl.get_stream_status()
+            if status.output_active:
+                print("Stream already active, stopping first...")
+                listening = _arm_stream_wait()
+                cl.stop_stream()
+                if not _wait_stream_state(False, 15, listening):
+                    raise RuntimeError("Timed out waiting for existing stream to stop")
+            listening = _arm_stream_wait()
+            cl.start_stream()
+        return listening
+
+    listening = _reconnecting(request_start)
+
+    # Verify stream actually went live (OBS needs a moment)
+    if _wait_stream_state(True, verify_timeout, listening):
+        return
     raise RuntimeError(
         f"Stream did not go live within {verify_timeout}s — "
         "check stream key, RTMP endpoint, and OBS stream settings"
@@ -185,27 +672,21 @@ def stop_streaming(verify_timeout: int = 15) -> None:
     Raises:
         RuntimeError: If stream fails to stop within timeout.
     """
-    cl = _connect()
-    try:
-        status = cl.get_stream_status()
-        if not status.output_active:
-            return  # already stopped
-        cl.stop_stream()
-    finally:
-        cl.disconnect()
-
-    for i in range(verify_timeout):
-        time.sleep(1)
-        try:
-            cl2 = _connect()
-            try:
-                if not cl2.get_stream_status().output_active:
-                    return
-            finally:
-                cl2.disconnect()
-        except Exception:
-            pass
-    raise RuntimeError(f"Stream did not stop within {verify_timeout}s")
+    def request_stop() -> bool | None:
+        # Starts from a status query, so safe to rerun on a new connection
+        with _session() as cl:
+            status = cl.get_stream_status()
+            if not status.output_active:
+                return None  # already stopped
+            listening = _arm_stream_wait()
+            cl.stop_stream()
+        return listening
+
+    listening = _reconnecting(request_stop)
+    if listening is None:
+        return
+    if not _wait_stream_state(False, verify_timeout, listening):
+        raise RuntimeError(f"Stream did not stop within {verify_timeout}s")
 
 
 def emergency_stop_stream(started_flag: list[bool], signum=None, frame=None) -> None:
@@ -217,10 +698,12 @@ def emergency_stop_stream(started_flag: list[bool], signum=None, frame=None) ->
     """
     if not started_flag or not started_flag[0]:
         return
+    # Don't reuse a connection the interrupted code may be mid-request on
+    _close()
     try:
-        print(f"\n!! Emergency stream stop (signal={signum}) ...", file=sys.stderr)
+        logger.warning("!! Emergency stream stop (signal=%s) ...", signum)
         stop_streaming(verify_timeout=5)
-        print("!! Stream stopped", file=sys.stderr)
+        logger.warning("!! Stream stopped")
     except Exception as e:
         try:
             cl = _connect()
@@ -228,125 +711,209 @@ def emergency_stop_stream(started_flag: list[bool], signum=None, frame=None) ->
             cl.disconnect()
         except Exception:
             pass
-        print(f"!! Emergency stop error: {e}", file=sys.stderr)
+        logger.error("!! Emergency stop error: %s", e)
     started_flag[0] = False
     if signum is not None:
         sys.exit(1)
 
 
-def set_stream_service(service_type: str, settings: dict) -> None:
+@_with_obs
+def set_stream_service(cl: "obs.ReqClient", service_type: str, settings: dict) -> None:
     """Set the stream service (e.g. Twitch RTMP destination and stream key)."""
-    cl = _connect()
-    try:
-        cl.set_stream_service_settings(
-            ss_type=service_type,
-            ss_settings=settings,
-        )
-    finally:
-        cl.disconnect()
+    cl.set_stream_service_settings(
+        ss_type=service_type,
+        ss_settings=settings,
+    )
 
 
-def get_stream_service() -> dict:
+@_with_obs
+def get_stream_service(cl: "obs.ReqClient") -> dict:
     """Get current stream service settings."""
-    cl = _connect()
-    try:
-        resp = cl.get_stream_service_settings()
-        return {
-            "type": resp.stream_service_type,
-            "settings": resp.stream_service_settings,
-        }
-    finally:
-        cl.disconnect()
-
-
-def set_source_visibility(scene: str, source: str, visible: bool) -> None:
-    """Toggle a source's visibility in a scene."""
-    cl = _connect()
-    try:
-        item_id = cl.get_scene_item_id(scene, source).scene_item_id
-        cl.set_scene_item_enabled(scene, item_id, visible)
-    finally:
-        cl.disconnect()
+    resp = cl.get_stream_service_settings()
+    return {
+        "type": resp.stream_service_type,
+        "settings": resp.stream_service_settings,
+    }
+
+
+@_with_obs
+def set_source_visibility(
+    cl: "obs.ReqClient", scene: str, source: str, visible: bool,
+) -> None:
+    """Toggle a source's visibility in a scene.
+
+    Raises OBSSDKRequestError if the source is not in the scene.
+    """
+    item_id = _scene_item_id(cl, scene, source)
+    if item_id is None:
+        raise OBSSDKRequestError("GetSceneItemId", RESOURCE_NOT_FOUND,
+                                 f"No source '{source}' in scene '{scene}'")
+    cl.set_scene_item_enabled(scene, item_id, visible)
 
 
 # ── Scene / source setup ──────────────────────────────────────────
 
-def create_scene(name: str) -> None:
+@_with_obs
+def create_scene(cl: "obs.ReqClient", name: str) -> None:
     """Create a new scene (no-op if it already exists)."""
-    cl = _connect()
-    try:
-        existing = [s["sceneName"] for s in cl.get_scene_list().scenes]
-        if name in existing:
-            return
-        cl.create_scene(name)
-    finally:
-        cl.disconnect()
+    existing = _known_scenes(cl)
+    if existing is None:
+        existing = {s["sceneName"] for s in cl.get_scene_list().scenes}
+    if name in existing:
+        return
+    cl.create_scene(name)
+    _remember_scene(name)
 
 
-def create_media_source(scene: str, source: str) -> None:
-    """Create a media source in a scene (no-op if it already exists).
+def _ensure_scene_input(
+    cl: "obs.ReqClient", scene: str, source: str, kind: str, settings: dict,
+    fit: bool = True, on_existing: tuple = (), on_both: tuple = (),
+) -> None:
+    """Make sure an input is in a scene, creating it if needed.
 
-    After creation, sets the scene item transform to fill the canvas.
+    Each path is one serial RequestBatch: use (or create) the item, then,
+    if fit, enable it and fill the canvas. on_existing runs only for an
+    existing item; on_both runs either way (last, so a failure there is
+    harmless). The item is found from the event-mirrored inventory when
+    available, otherwise by a GetSceneItemId lookup at the head of the
+    batch whose sceneItemId is piped into the following requests.
+
+    Raises OBSSDKRequestError if the input could not be created.
     """
-    cl = _connect()
-    try:
-        # Check if source already exists in scene
-        try:
-            item_id = cl.get_scene_item_id(scene, source).scene_item_id
-            # Source exists - ensure it's enabled and fullscreen
-            cl.set_scene_item_enabled(scene, item_id, True)
-            _set_fullscreen_transform(cl, scene, item_id)
+    items = _known_items(cl, scene)
+    item_id = items.get(source) if items is not None else None
+
+    def on_item(request_type: str, data: dict, item_id: int | None) -> dict:
+        if item_id is not None:
+            return {"requestType": request_type,
+                    "requestData": {**data, "sceneItemId": item_id}}
+        return {"requestType": request_type, "requestData": data,
+                "inputVariables": {"sceneItemId": "itemId"}}
+
+    def fit_requests(item_id: int | None, enable: bool) -> list[dict]:
+        if not fit:
+            return []
+        transform = on_item("SetSceneItemTransform", {
+            "sceneName": scene, "sceneItemTransform": _fullscreen_transform(cl),
+        }, item_id)
+        if not enable:
+            return [transform]
+        return [on_item("SetSceneItemEnabled",
+                        {"sceneName": scene, "sceneItemEnabled": True}, item_id),
+                transform]
+
+    if item_id is not None:
+        requests = [*fit_requests(item_id, True), *on_existing, *on_both]
+        if requests:
+            _batch(cl, requests, halt_on_failure=True, check=False)
+        return
+
+    if items is None:
+        found = _batch(cl, [
+            {"requestType": "GetSceneItemId",
+             "requestData": {"sceneName": scene, "sourceName": source},
+             "outputVariables": {"itemId": "sceneItemId"}},
+            *fit_requests(None, True), *on_existing, *on_both,
+        ], halt_on_failure=True, check=False)
+        if found[0]["requestStatus"]["result"]:
             return
-        except Exception:
-            pass
 
-        # Create the input
-        try:
-            resp = cl.create_input(scene, source, "ffmpeg_source", {"local_file": ""}, True)
-            item_id = resp.scene_item_id
-            # Set transform to fill canvas
-            _set_fullscreen_transform(cl, scene, item_id)
-        except Exception as e:
-            print(f"Failed to create media source '{source}' in scene '{scene}': {e}",
-                  file=sys.stderr)
-    finally:
-        cl.disconnect()
-
-
-def _set_fullscreen_transform(cl: obs.ReqClient, scene: str, item_id: int) -> None:
-    """Set a scene item to fill the canvas (1920x1080 assumed)."""
+    created = _batch(cl, [
+        {"requestType": "CreateInput",
+         "requestData": {"sceneName": scene, "inputName": source,
+                         "inputKind": kind, "inputSettings": settings,
+                         "sceneItemEnabled": True},
+         "outputVariables": {"itemId": "sceneItemId"}},
+        *fit_requests(None, False), *on_both,
+    ], halt_on_failure=True, check=False)
+    status = created[0]["requestStatus"]
+    if not status["result"]:
+        raise OBSSDKRequestError("CreateInput", status["code"], status.get("comment"))
+    _remember_item(scene, source, created[0]["responseData"]["sceneItemId"])
+
+
+@_with_obs
+def create_media_source(cl: "obs.ReqClient", scene: str, source: str) -> None:
+    """Create a media source in a scene (no-op if it already exists).
+
+    After creation, sets the scene item transform to fill the canvas.
+    """
     try:
-        # Get video settings for base resolution
-        video = cl.get_video_settings()
-        width = video.base_width
-        height = video.base_height
-    except Exception:
-        # Fallback to 1080p
-        width, height = 1920, 1080
-
-    # Set transform: position at origin, bounds to fill canvas
-    cl.set_scene_item_transform(
-        scene,
-        item_id,
-        {
-            "positionX": 0,
-            "positionY": 0,
-            "boundsType": "OBS_BOUNDS_SCALE_INNER",
-            "boundsWidth": width,
-            "boundsHeight": height,
-            "boundsAlignment": 0,
-        },
-    )
+        _ensure_scene_input(cl, scene, source, "ffmpeg_source", {"local_file": ""})
+    except Exception as e:
+        logger.warning("Failed to create media source '%s' in scene '%s': %s",
+                       source, scene, e)
 
 
-def ensure_playback_scene(scene: str, source: str) -> None:
-    """Create the playback scene and media source if they don't exist."""
-    create_scene(scene)
-    create_media_source(scene, source)
+def _canvas_size(cl: "obs.ReqClient") -> tuple[int, int]:
+    """Canvas base resolution, fetched once per connection (1080p fallback)."""
+    global _canvas
+    if _canvas is None:
+        try:
+            video = cl.get_video_settings()
+        except Exception:
+            return 1920, 1080  # not cached, so the next call retries
+        _canvas = (video.base_width, video.base_height)
+    return _canvas
+
+
+def _fullscreen_transform(cl: "obs.ReqClient") -> dict:
+    """Scene item transform that fills the canvas."""
+    width, height = _canvas_size(cl)
+    # Position at origin, bounds to fill canvas
+    return {
+        "positionX": 0,
+        "positionY": 0,
+        "boundsType": "OBS_BOUNDS_SCALE_INNER",
+        "boundsWidth": width,
+        "boundsHeight": height,
+        "boundsAlignment": 0,
+    }
+
+
+@_with_obs
+def ensure_playback_scene(cl: "obs.ReqClient", scene: str, source: str) -> None:
+    """Create the playback scene and media source if they don't exist.
+
+    One non-halting RequestBatch: CreateScene and CreateInput are simply
+    allowed to fail with "already exists", after which GetSceneItemId
+    finds the item either way and its id is piped into the enable and
+    fill-canvas requests.
+    """
+    by_item = {"inputVariables": {"sceneItemId": "itemId"}}
+    results = _batch(cl, [
+        {"requestType": "CreateScene", "requestData": {"sceneName": scene}},
+        {"requestType": "CreateInput",
+         "requestData": {"sceneName": scene, "inputName": source,
+                         "inputKind": "ffmpeg_source",
+                         "inputSettings": {"local_file": ""},
+                         "sceneItemEnabled": True}},
+        {"requestType": "GetSceneItemId",
+         "requestData": {"sceneName": scene, "sourceName": source},
+         "outputVariables": {"itemId": "sceneItemId"}},
+        {"requestType": "SetSceneItemEnabled",
+         "requestData": {"sceneName": scene, "sceneItemEnabled": True},
+         **by_item},
+        {"requestType": "SetSceneItemTransform",
+         "requestData": {"sceneName": scene,
+                         "sceneItemTransform": _fullscreen_transform(cl)},
+         **by_item},
+    ], check=False)
+    scene_status, _, lookup = (r["requestStatus"] for r in results[:3])
+    if not scene_status["result"] and scene_status["code"] != RESOURCE_ALREADY_EXISTS:
+        raise OBSSDKRequestError("CreateScene", scene_status["code"],
+                                 scene_status.get("comment"))
+    _remember_scene(scene)
+    if not lookup["result"]:
+        logger.warning("Failed to create media source '%s' in scene '%s': %s",
+                       source, scene, lookup.get("comment"))
+        return
+    _remember_item(scene, source, results[2]["responseData"]["sceneItemId"])
 
 
+@_with_obs
 def create_browser_source(
-    scene: str, source: str, url: str,
+    cl: "obs.ReqClient", scene: str, source: str, url: str,
     width: int = 1920, height: int = 1080,
 ) -> None:
     """Create a browser source in a scene (no-op if it already exists).
@@ -354,304 +921,331 @@ def create_browser_source(
     Browser sources render a web page as an OBS input — ideal for
     overlays, crawl animations, and live game state displays.
     """
-    cl = _connect()
     try:
-        # Check if source already exists in scene
-        try:
-            item_id = cl.get_scene_item_id(scene, source).scene_item_id
-            cl.set_scene_item_enabled(scene, item_id, True)
-            _set_fullscreen_transform(cl, scene, item_id)
+        _ensure_scene_input(
+            cl, scene, source, "browser_source",
+            {
+                "url": url,
+                "width": width,
+                "height": height,
+                "reroute_audio": True,
+            },
             # Ensure audio is routed through OBS mixer (not desktop audio)
-            cl.set_input_settings(source, {"reroute_audio": True}, overlay=True)
-            # Route audio to stream output (not just meters)
-            try:
-                cl.set_input_audio_monitor_type(source, "OBS_MONITORING_TYPE_MONITOR_AND_OUTPUT")
-            except Exception:
-                pass  # older OBS versions may not support this
-            return
-        except Exception:
-            pass
-
-        try:
-            resp = cl.create_input(
-                scene, source, "browser_source",
-                {
-                    "url": url,
-                    "width": width,
-                    "height": height,
-                    "reroute_audio": True,
-                },
-                True,
-            )
-            _set_fullscreen_transform(cl, scene, resp.scene_item_id)
-            # Route audio to stream output (not just meters)
-            try:
-                cl.set_input_audio_monitor_type(source, "OBS_MONITORING_TYPE_MONITOR_AND_OUTPUT")
-            except Exception:
-                pass
-        except Exception as e:
-            print(
-                f"Failed to create browser source '{source}' in scene '{scene}': {e}",
-                file=sys.stderr,
-            )
-    finally:
-        cl.disconnect()
+            on_existing=({"requestType": "SetInputSettings",
+                          "requestData": {"inputName": source,
+                                          "inputSettings": {"reroute_audio": True},
+                                          "overlay": True}},),
+            # Route audio to stream output (not just meters); older OBS
+            # versions may not support this
+            on_both=({"requestType": "SetInputAudioMonitorType",
+                      "requestData": {"inputName": source,
+                                      "monitorType": "OBS_MONITORING_TYPE_MONITOR_AND_OUTPUT"}},),
+        )
+    except Exception as e:
+        logger.warning("Failed to create browser source '%s' in scene '%s': %s",
+                       source, scene, e)
 
 
-def set_browser_source_url(source: str, url: str) -> None:
+@_with_obs
+def set_browser_source_url(cl: "obs.ReqClient", source: str, url: str) -> None:
     """Update the URL on an existing browser source."""
-    cl = _connect()
-    try:
-        cl.set_input_settings(source, {"url": url}, overlay=True)
-    finally:
-        cl.disconnect()
+    cl.set_input_settings(source, {"url": url}, overlay=True)
 
 
-def refresh_browser_source(source: str) -> None:
+@_with_obs
+def refresh_browser_source(cl: "obs.ReqClient", source: str) -> None:
     """Force a browser source to reload its page."""
-    cl = _connect()
-    try:
-        cl.press_input_properties_button(source, "refreshnocache")
-    finally:
-        cl.disconnect()
+    cl.press_input_properties_button(source, "refreshnocache")
 
 
+@_with_obs
 def create_text_source(
-    scene: str, source: str, text: str,
+    cl: "obs.ReqClient", scene: str, source: str, text: str,
     font_size: int = 48, color: int = 0xFFFFFFFF,
 ) -> None:
     """Create a GDI+ text source in a scene (no-op if it already exists)."""
-    cl = _connect()
     try:
-        try:
-            cl.get_scene_item_id(scene, source)
+        _ensure_scene_input(
+            cl, scene, source, "text_gdiplus_v2",
+            {
+                "text": text,
+                "font": {"face": "Arial", "size": font_size},
+                "color": color,
+            },
+            fit=False,
             # Already exists — just update the text
-            cl.set_input_settings(source, {"text": text}, overlay=True)
-            return
-        except Exception:
-            pass
+            on_existing=({"requestType": "SetInputSettings",
+                          "requestData": {"inputName": source,
+                                          "inputSettings": {"text": text},
+                                          "overlay": True}},),
+        )
+    except Exception as e:
+        logger.warning("Failed to create text source '%s' in scene '%s': %s",
+                       source, scene, e)
 
-        try:
-            cl.create_input(
-                scene, source, "text_gdiplus_v2",
-                {
-                    "text": text,
-                    "font": {"face": "Arial", "size": font_size},
-                    "color": color,
-                },
-                True,
-            )
-        except Exception as e:
-            print(
-                f"Failed to create text source '{source}' in scene '{scene}': {e}",
-                file=sys.stderr,
-            )
-    finally:
-        cl.disconnect()
-
-
-def update_text_source(source: str, text: str) -> None:
+
+@_with_obs
+def update_text_source(cl: "obs.ReqClient", source: str, text: str) -> None:
     """Update the text on an existing text source."""
-    cl = _connect()
-    try:
-        cl.set_input_settings(source, {"text": text}, overlay=True)
-    finally:
-        cl.disconnect()
+    cl.set_input_settings(source, {"text": text}, overlay=True)
 
 
 # ── Media control ─────────────────────────────────────────────────
 
-def set_media_source(source: str, file_path: str, looping: bool = False) -> None:
+# Media states meaning OBS has finished opening the file it was given
+_MEDIA_LOADED_STATES = {
+    "OBS_MEDIA_STATE_PLAYING",
+    "OBS_MEDIA_STATE_PAUSED",
+    "OBS_MEDIA_STATE_STOPPED",
+    "OBS_MEDIA_STATE_BUFFERING",
+    "OBS_MEDIA_STATE_ENDED",
+}
+MEDIA_LOAD_WAIT = 0.5
+MEDIA_LOAD_POLL = 0.05
+
+
+def _media_load_snapshot(cl: "obs.ReqClient", source: str) -> tuple[str, int | None]:
+    status = cl.get_media_input_status(source)
+    return status.media_state, status.media_duration
+
+
+@_with_obs
+def set_media_source(cl: "obs.ReqClient", source: str, file_path: str, looping: bool = False) -> None:
     """Set the file path on a media source and trigger playback.
 
-    After setting the path, triggers a RESTART action to ensure OBS
-    loads and plays the new file.
+    After setting the path, waits (up to MEDIA_LOAD_WAIT) for OBS to
+    report the new file opened, then triggers a RESTART action to ensure
+    it plays from the start.
     """
-    cl = _connect()
-    try:
-        cl.set_input_settings(
-            source,
-            {"local_file": file_path, "looping": looping},
-            overlay=True,
-        )
-        # Give OBS time to recognize the file, then restart playback
-        import time
-        time.sleep(0.5)
-        cl.trigger_media_input_action(
-            source, "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART"
-        )
-    finally:
-        cl.disconnect()
+    # The source still reports the previous file until the new one opens,
+    # so wait for its state or duration to move away from this snapshot
+    before = _media_load_snapshot(cl, source)
+    cl.set_input_settings(
+        source,
+        {"local_file": file_path, "looping": looping},
+        overlay=True,
+    )
+    deadline = time.monotonic() + MEDIA_LOAD_WAIT
+    while time.monotonic() < deadline:
+        state, duration = _media_load_snapshot(cl, source)
+        if state in _MEDIA_LOADED_STATES and (state, duration) != before:
+            break
+        time.sleep(MEDIA_LOAD_POLL)
+    cl.trigger_media_input_action(
+        source, "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART"
+    )
 
 
-def set_input_volume(source: str, db: float) -> None:
+@_with_obs
+def set_input_volume(cl: "obs.ReqClient", source: str, db: float) -> None:
     """Set the volume of an input source in dB (0 = unity, -6 = half, etc.)."""
-    cl = _connect()
-    try:
-        cl.set_input_volume(source, vol_db=db)
-    finally:
-        cl.disconnect()
+    cl.set_input_volume(source, vol_db=db)
 
 
-def trigger_media_action(source: str, action: str) -> None:
+@_with_obs
+def trigger_media_action(cl: "obs.ReqClient", source: str, action: str) -> None:
     """Trigger a media action (restart, play, pause, stop, next, previous)."""
-    cl = _connect()
-    try:
-        cl.trigger_media_input_action(source, action)
-    finally:
-        cl.disconnect()
+    cl.trigger_media_input_action(source, action)
 
 
-def get_media_status(source: str) -> dict:
+@_with_obs
+def get_media_status(cl: "obs.ReqClient", source: str) -> dict:
     """Get media playback state and cursor position."""
-    cl = _connect()
-    try:
-        status = cl.get_media_input_status(source)
-        return {
-            "state": status.media_state,
-            "cursor": status.media_cursor,
-            "duration": status.media_duration,
-        }
-    finally:
-        cl.disconnect()
+    status = cl.get_media_input_status(source)
+    return {
+        "state": status.media_state,
+        "cursor": status.media_cursor,
+        "duration": status.media_duration,
+    }
 
 
 # ── CLI ──────────────────────────────────────────────────────────
 
-COMMANDS = {
-    "status": "Show OBS status (WebSocket)",
-    "scenes": "List available scenes",
-    "switch": "Switch scene (usage: switch <name>)",
-    "start": "Start streaming",
-    "stop": "Stop streaming",
-    "set-media": "Set media source file (usage: set-media <source> <path>)",
-    "play": "Play/restart a media source (usage: play <source>)",
-    "media-status": "Get media playback status (usage: media-status <source>)",
-    "setup": "Create playback scene and media source",
-    "add-browser": "Add browser source (usage: add-browser <scene> <source> <url>)",
-    "set-browser-url": "Update browser URL (usage: set-browser-url <source> <url>)",
-    "refresh-browser": "Reload a browser source (usage: refresh-browser <source>)",
-    "add-text": "Add text source (usage: add-text <scene> <source> <text>)",
-    "set-text": "Update text content (usage: set-text <source> <text>)",
-    "launch": "Launch OBS via host launcher",
-    "kill": "Kill OBS via host launcher",
-    "launcher-status": "Check host launcher status",
+def _usage(args: str) -> int:
+    print(f"Usage: obs_client.py {args}", file=sys.stderr)
+    return 1
+
+
+# get_status() has a fixed shape, so `status` fills a template rather
+# than going through json.dumps; output is identical to indent=2.
+_STATUS_JSON = (
+    '{{\n'
+    '  "connected": {connected},\n'
+    '  "obs_version": {obs_version},\n'
+    '  "streaming": {streaming},\n'
+    '  "stream_duration": {stream_duration},\n'
+    '  "current_scene": {current_scene}\n'
+    '}}'
+)
+
+
+def _format_status(s: dict) -> str:
+    return _STATUS_JSON.format(
+        connected="true" if s["connected"] else "false",
+        obs_version=encode_basestring_ascii(s["obs_version"]),
+        streaming="true" if s["streaming"] else "false",
+        stream_duration=int(s["stream_duration"]),
+        current_scene=encode_basestring_ascii(s["current_scene"]),
+    )
+
+
+def _cmd_status(argv: list[str]) -> int:
+    try:
+        s = get_status()
+    except Exception as e:
+        print(f"OBS not reachable: {e}", file=sys.stderr)
+        return 1
+    print(_format_status(s))
+    return 0
+
+
+def _cmd_scenes(argv: list[str]) -> int:
+    for name in get_scenes():
+        print(f"  {name}")
+    return 0
+
+
+def _cmd_switch(argv: list[str]) -> int:
+    if len(argv) < 1:
+        return _usage("switch <scene_name>")
+    switch_scene(argv[0])
+    print(f"Switched to: {argv[0]}")
+    return 0
+
+
+def _cmd_start(argv: list[str]) -> int:
+    start_streaming()
+    print("Streaming started")
+    return 0
+
+
+def _cmd_stop(argv: list[str]) -> int:
+    stop_streaming()
+    print("Streaming stopped")
+    return 0
+
+
+def _cmd_set_media(argv: list[str]) -> int:
+    if len(argv) < 2:
+        return _usage("set-media <source> <path>")
+    set_media_source(argv[0], argv[1])
+    print(f"Set {argv[0]} → {argv[1]}")
+    return 0
+
+
+def _cmd_play(argv: list[str]) -> int:
+    if len(argv) < 1:
+        return _usage("play <source>")
+    trigger_media_action(argv[0], "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART")
+    print(f"Playing: {argv[0]}")
+    return 0
+
+
+def _cmd_media_status(argv: list[str]) -> int:
+    if len(argv) < 1:
+        return _usage("media-status <source>")
+    print(_json_dumps(get_media_status(argv[0]), indent=True))
+    return 0
+
+
+def _cmd_setup(argv: list[str]) -> int:
+    scene = os.environ.get("OBS_PLAYBACK_SCENE", "Episode Playback")
+    source = os.environ.get("OBS_MEDIA_SOURCE", "EpisodeVideo")
+    ensure_playback_scene(scene, source)
+    print(f"Scene '{scene}' with source '{source}' ready")
+    return 0
+
+
+def _cmd_add_browser(argv: list[str]) -> int:
+    if len(argv) < 3:
+        return _usage("add-browser <scene> <source> <url>")
+    create_browser_source(argv[0], argv[1], argv[2])
+    print(f"Browser source '{argv[1]}' added to '{argv[0]}'")
+    return 0
+
+
+def _cmd_set_browser_url(argv: list[str]) -> int:
+    if len(argv) < 2:
+        return _usage("set-browser-url <source> <url>")
+    set_browser_source_url(argv[0], argv[1])
+    print(f"Updated browser URL: {argv[1]}")
+    return 0
+
+
+def _cmd_refresh_browser(argv: list[str]) -> int:
+    if len(argv) < 1:
+        return _usage("refresh-browser <source>")
+    refresh_browser_source(argv[0])
+    print(f"Refreshed: {argv[0]}")
+    return 0
+
+
+def _cmd_add_text(argv: list[str]) -> int:
+    if len(argv) < 3:
+        return _usage("add-text <scene> <source> <text>")
+    create_text_source(argv[0], argv[1], " ".join(argv[2:]))
+    print(f"Text source '{argv[1]}' added to '{argv[0]}'")
+    return 0
+
+
+def _cmd_set_text(argv: list[str]) -> int:
+    if len(argv) < 2:
+        return _usage("set-text <source> <text>")
+    update_text_source(argv[0], " ".join(argv[1:]))
+    print(f"Updated text: {argv[0]}")
+    return 0
+
+
+def _cmd_launch(argv: list[str]) -> int:
+    ok = launch_obs()
+    print(f"OBS running: {ok}")
+    return 0 if ok else 1
+
+
+def _cmd_kill(argv: list[str]) -> int:
+    print(f"OBS stopped: {kill_obs()}")
+    return 0
+
+
+def _cmd_launcher_status(argv: list[str]) -> int:
+    print(_json_dumps(launcher_status(), indent=True))
+    return 0
+
+
+# name → (help text, handler taking the remaining argv, returning exit code)
+COMMANDS: dict[str, tuple[str, Callable[[list[str]], int]]] = {
+    "status": ("Show OBS status (WebSocket)", _cmd_status),
+    "scenes": ("List available scenes", _cmd_scenes),
+    "switch": ("Switch scene (usage: switch <name>)", _cmd_switch),
+    "start": ("Start streaming", _cmd_start),
+    "stop": ("Stop streaming", _cmd_stop),
+    "set-media": ("Set media source file (usage: set-media <source> <path>)", _cmd_set_media),
+    "play": ("Play/restart a media source (usage: play <source>)", _cmd_play),
+    "media-status": ("Get media playback status (usage: media-status <source>)", _cmd_media_status),
+    "setup": ("Create playback scene and media source", _cmd_setup),
+    "add-browser": ("Add browser source (usage: add-browser <scene> <source> <url>)", _cmd_add_browser),
+    "set-browser-url": ("Update browser URL (usage: set-browser-url <source> <url>)", _cmd_set_browser_url),
+    "refresh-browser": ("Reload a browser source (usage: refresh-browser <source>)", _cmd_refresh_browser),
+    "add-text": ("Add text source (usage: add-text <scene> <source> <text>)", _cmd_add_text),
+    "set-text": ("Update text content (usage: set-text <source> <text>)", _cmd_set_text),
+    "launch": ("Launch OBS via host launcher", _cmd_launch),
+    "kill": ("Kill OBS via host launcher", _cmd_kill),
+    "launcher-status": ("Check host launcher status", _cmd_launcher_status),
 }
 
 
 def main() -> None:
-    if len(sys.argv) < 2 or sys.argv[1] not in COMMANDS:
+    global _track_inventory
+    _track_inventory = False
+    logging.basicConfig(level=os.environ.get("OBS_LOG_LEVEL", "WARNING").upper(),
+                        format="%(message)s")
+    command = COMMANDS.get(sys.argv[1]) if len(sys.argv) >= 2 else None
+    if command is None:
         print("Usage: obs_client.py <command>")
-        for cmd, desc in COMMANDS.items():
+        for cmd, (desc, _) in COMMANDS.items():
             print(f"  {cmd:20s} {desc}")
         sys.exit(1)
-
-    cmd = sys.argv[1]
-
-    if cmd == "status":
-        try:
-            s = get_status()
-            print(json.dumps(s, indent=2))
-        except Exception as e:
-            print(f"OBS not reachable: {e}", file=sys.stderr)
-            sys.exit(1)
-
-    elif cmd == "scenes":
-        for name in get_scenes():
-            print(f"  {name}")
-
-    elif cmd == "switch":
-        if len(sys.argv) < 3:
-            print("Usage: obs_client.py switch <scene_name>", file=sys.stderr)
-            sys.exit(1)
-        switch_scene(sys.argv[2])
-        print(f"Switched to: {sys.argv[2]}")
-
-    elif cmd == "start":
-        start_streaming()
-        print("Streaming started")
-
-    elif cmd == "stop":
-        stop_streaming()
-        print("Streaming stopped")
-
-    elif cmd == "setup":
-        scene = os.environ.get("OBS_PLAYBACK_SCENE", "Episode Playback")
-        source = os.environ.get("OBS_MEDIA_SOURCE", "EpisodeVideo")
-        ensure_playback_scene(scene, source)
-        print(f"Scene '{scene}' with source '{source}' ready")
-
-    elif cmd == "set-media":
-        if len(sys.argv) < 4:
-            print("Usage: obs_client.py set-media <source> <path>", file=sys.stderr)
-            sys.exit(1)
-        set_media_source(sys.argv[2], sys.argv[3])
-        print(f"Set {sys.argv[2]} → {sys.argv[3]}")
-
-    elif cmd == "play":
-        if len(sys.argv) < 3:
-            print("Usage: obs_client.py play <source>", file=sys.stderr)
-            sys.exit(1)
-        trigger_media_action(
-            sys.argv[2], "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART",
-        )
-        print(f"Playing: {sys.argv[2]}")
-
-    elif cmd == "media-status":
-        if len(sys.argv) < 3:
-            print("Usage: obs_client.py media-status <source>", file=sys.stderr)
-            sys.exit(1)
-        s = get_media_status(sys.argv[2])
-        print(json.dumps(s, indent=2))
-
-    elif cmd == "add-browser":
-        if len(sys.argv) < 5:
-            print("Usage: obs_client.py add-browser <scene> <source> <url>", file=sys.stderr)
-            sys.exit(1)
-        create_browser_source(sys.argv[2], sys.argv[3], sys.argv[4])
-        print(f"Browser source '{sys.argv[3]}' added to '{sys.argv[2]}'")
-
-    elif cmd == "set-browser-url":
-        if len(sys.argv) < 4:
-            print("Usage: obs_client.py set-browser-url <source> <url>", file=sys.stderr)
-            sys.exit(1)
-        set_browser_source_url(sys.argv[2], sys.argv[3])
-        print(f"Updated browser URL: {sys.argv[3]}")
-
-    elif cmd == "refresh-browser":
-        if len(sys.argv) < 3:
-            print("Usage: obs_client.py refresh-browser <source>", file=sys.stderr)
-            sys.exit(1)
-        refresh_browser_source(sys.argv[2])
-        print(f"Refreshed: {sys.argv[2]}")
-
-    elif cmd == "add-text":
-        if len(sys.argv) < 5:
-            print("Usage: obs_client.py add-text <scene> <source> <text>", file=sys.stderr)
-            sys.exit(1)
-        create_text_source(sys.argv[2], sys.argv[3], " ".join(sys.argv[4:]))
-        print(f"Text source '{sys.argv[3]}' added to '{sys.argv[2]}'")
-
-    elif cmd == "set-text":
-        if len(sys.argv) < 4:
-            print("Usage: obs_client.py set-text <source> <text>", file=sys.stderr)
-            sys.exit(1)
-        update_text_source(sys.argv[2], " ".join(sys.argv[3:]))
-        print(f"Updated text: {sys.argv[2]}")
-
-    elif cmd == "launch":
-        ok = launch_obs()
-        print(f"OBS running: {ok}")
-        if not ok:
-            sys.exit(1)
-
-    elif cmd == "kill":
-        ok = kill_obs()
-        print(f"OBS stopped: {ok}")
-
-    elif cmd == "launcher-status":
-        s = launcher_status()
-        print(json.dumps(s, indent=2))
+    sys.exit(command[1](sys.argv[2:]))
 
 
 if __name__ == "__main__":
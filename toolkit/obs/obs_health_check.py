@@ -8,10 +8,13 @@ Usage (inside Docker):
     python3 /app/toolkit/obs/obs_health_check.py
 """
 
+import functools
 import json
+import mmap
 import os
+import stat
 import sys
-import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
@@ -20,27 +23,87 @@ import obs_client
 ET = ZoneInfo("America/New_York")
 
 SCHEDULE_FILE = "/home/node/clawd-twitch/schedule.md"
+# Last answer for SCHEDULE_FILE, reused by later cron runs while valid.
+# Per-user, since the cached topic is trusted as is.
+SCHEDULE_CACHE = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "clawd", "obs_health_sched.json",
+)
 
 
 def is_stream_scheduled_today() -> str | None:
     """Check schedule.md for a stream scheduled today.
 
-    Returns the topic name if scheduled, None otherwise.
+    Returns the topic name if scheduled, None otherwise. The answer is
+    kept in SCHEDULE_CACHE keyed on the file's mtime and today's date,
+    so cron ticks where neither changed only stat the schedule.
     """
-    if not os.path.isfile(SCHEDULE_FILE):
+    try:
+        st = os.stat(SCHEDULE_FILE)
+    except OSError:
         return None
+    if not stat.S_ISREG(st.st_mode):
+        return None  # directory or special file: nothing to read
+    mtime_ns = st.st_mtime_ns
 
     today = datetime.now(ET).strftime("%Y-%m-%d")
-    with open(SCHEDULE_FILE) as f:
-        for line in f:
-            if "|" not in line or line.strip().startswith("|--"):
-                continue
-            cells = [c.strip() for c in line.split("|") if c.strip()]
-            if len(cells) < 6:
-                continue
-            date, _time, topic, _series, _type, status = cells[:6]
-            if date == today and status.lower() == "scheduled":
-                return topic
+    key = {"path": SCHEDULE_FILE, "mtime_ns": mtime_ns, "date": today}
+    try:
+        with open(SCHEDULE_CACHE) as f:
+            cached = json.load(f)
+        if all(cached.get(k) == v for k, v in key.items()):
+            return cached.get("topic")
+    except (OSError, ValueError, AttributeError):
+        pass  # missing or unreadable cache: just rescan
+
+    topic = _scheduled_topic(SCHEDULE_FILE, mtime_ns, today)
+    try:
+        os.makedirs(os.path.dirname(SCHEDULE_CACHE), mode=0o700, exist_ok=True)
+        tmp = f"{SCHEDULE_CACHE}.{os.getpid()}"
+        with open(tmp, "w") as f:
+            json.dump({**key, "topic": topic}, f)
+        os.replace(tmp, SCHEDULE_CACHE)
+    except OSError:
+        pass
+    return topic
+
+
+@functools.lru_cache(maxsize=4)
+def _scheduled_topic(path: str, mtime_ns: int, today: str) -> str | None:
+    """Scan a schedule file for today's scheduled row (cached per mtime).
+
+    The file is mapped and searched for today's date directly, so only
+    rows containing it are ever decoded and split.
+    """
+    needle = today.encode()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap can't map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = mm.find(needle)
+            while pos >= 0:
+                start = mm.rfind(b"\n", 0, pos) + 1
+                end = mm.find(b"\n", pos)
+                if end < 0:
+                    end = len(mm)
+                topic = _scheduled_row_topic(
+                    mm[start:end].decode(errors="replace"), today)
+                if topic:
+                    return topic
+                pos = mm.find(needle, end)
+    return None
+
+
+def _scheduled_row_topic(line: str, today: str) -> str | None:
+    """Topic of a schedule table row if it is today's and scheduled."""
+    if "|" not in line or line.strip().startswith("|--"):
+        return None
+    cells = [c.strip() for c in line.split("|") if c.strip()]
+    if len(cells) < 6:
+        return None
+    date, _time, topic, _series, _type, status = cells[:6]
+    if date == today and status.lower() == "scheduled":
+        return topic
     return None
 
 
@@ -52,6 +115,19 @@ def main() -> None:
 
     print(f"Stream scheduled: {topic}", flush=True)
 
+    # Query OBS over the WebSocket while the launcher is asked over HTTP,
+    # but only if something is listening on the port; the answer is only
+    # used if the launcher reports OBS running.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        ws_status = pool.submit(obs_client.get_status) if obs_client.port_open() else None
+        _check_launcher(ws_status)
+
+
+def _check_launcher(ws_status: Future | None) -> None:
+    """Report launcher and OBS state, launching OBS if it isn't running.
+
+    ws_status: pending get_status() call, or None if the port was closed.
+    """
     # Check if OBS launcher is reachable
     try:
         launcher = obs_client.launcher_status()
@@ -63,9 +139,7 @@ def main() -> None:
 
     # Report launcher uptime if /health endpoint is available
     try:
-        health_resp = urllib.request.urlopen(
-            f"{obs_client.LAUNCHER_URL}/health", timeout=5)
-        health = json.loads(health_resp.read())
+        health = obs_client.launcher_health()
         uptime_min = health.get("uptime_seconds", 0) // 60
         print(f"Launcher uptime: {uptime_min}m (PID {health.get('pid')})",
               flush=True)
@@ -75,16 +149,21 @@ def main() -> None:
     if running:
         # OBS is running — report status
         try:
-            status = obs_client.get_status()
+            status = ws_status.result() if ws_status else None
+        except Exception:
+            status = None
+        if status is not None:
             streaming = status.get("streaming", False)
             scene = status.get("current_scene", "?")
             print(f"OBS running — scene: {scene}, streaming: {streaming}",
                   flush=True)
-        except Exception:
+        else:
             print("OBS process running but WebSocket not connected.",
                   flush=True)
     else:
         # OBS not running — launch it
+        if ws_status is not None:
+            ws_status.cancel()
         print("OBS not running, launching...", flush=True)
         try:
             ok = obs_client.launch_obs()
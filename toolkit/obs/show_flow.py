@@ -25,7 +25,6 @@ import atexit
 import functools
 import glob
 import os
-import re
 import signal
 import sys
 import time
@@ -34,24 +33,7 @@ from dataclasses import dataclass
 sys.path.insert(0, "/app/toolkit/cron-helpers")
 
 import obs_client
-from path_utils import RENDERS_DIR, to_windows_path
-
-
-def _fuzzy_find_episode_dir(base: str, slug: str) -> str | None:
-    """Find episode directory, tolerating 'and'/'the' differences in slugs."""
-    candidate = os.path.join(base, slug)
-    if os.path.isdir(candidate):
-        return candidate
-    stripped = re.sub(r"-(?:and|the|a)-", "-", slug)
-    if stripped != slug:
-        candidate = os.path.join(base, stripped)
-        if os.path.isdir(candidate):
-            return candidate
-    if os.path.isdir(base):
-        for d in os.listdir(base):
-            if re.sub(r"-(?:and|the|a)-", "-", d) == stripped:
-                return os.path.join(base, d)
-    return None
+from path_utils import RENDERS_DIR, fuzzy_find_episode_dir, to_windows_path
 
 
 # ── Emergency stream shutdown on process kill ──────────────────
@@ -119,12 +101,12 @@ def find_episode_intro(episode_name: str) -> str | None:
     for series_base in sorted(glob.glob(os.path.join(RENDERS_DIR, "*"))):
         if not os.path.isdir(series_base):
             continue
-        match = _fuzzy_find_episode_dir(series_base, episode_name)
+        match = fuzzy_find_episode_dir(series_base, episode_name)
         if match:
             hits = sorted(glob.glob(os.path.join(match, "intro-*.mp4")))
             if hits:
                 return hits[-1]
-    match = _fuzzy_find_episode_dir(RENDERS_DIR, episode_name)
+    match = fuzzy_find_episode_dir(RENDERS_DIR, episode_name)
     if match:
         hits = sorted(glob.glob(os.path.join(match, "intro-*.mp4")))
         if hits:
@@ -177,12 +159,12 @@ def find_episode_outro(episode_name: str) -> str | None:
     for series_base in sorted(glob.glob(os.path.join(RENDERS_DIR, "*"))):
         if not os.path.isdir(series_base):
             continue
-        match = _fuzzy_find_episode_dir(series_base, episode_name)
+        match = fuzzy_find_episode_dir(series_base, episode_name)
         if match:
             hits = sorted(glob.glob(os.path.join(match, "outro-*.mp4")))
             if hits:
                 return hits[-1]
-    match = _fuzzy_find_episode_dir(RENDERS_DIR, episode_name)
+    match = fuzzy_find_episode_dir(RENDERS_DIR, episode_name)
     if match:
         hits = sorted(glob.glob(os.path.join(match, "outro-*.mp4")))
         if hits:
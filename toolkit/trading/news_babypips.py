@@ -5,6 +5,7 @@ Fetches the daily market recap from BabyPips, extracts forex pair mentions,
 currency strength signals, and economic event references.
 """
 
+import codecs
 import re
 import sys
 import urllib.request
@@ -14,7 +15,16 @@ sys.path.insert(0, "/app/toolkit/cron-helpers")
 sys.path.insert(0, "/app/toolkit/education")
 from content_security import detect_suspicious, sanitize_field
 from forex_education import ContentExtractor
-from news_matching import _HEADERS, MAX_RESPONSE_BYTES
+from news_matching import _HEADERS, iter_response_chunks
+
+try:
+    from selectolax.lexbor import LexborHTMLParser as _FastHTMLParser
+except ImportError:
+    try:
+        # selectolax < 1.0 without the lexbor backend
+        from selectolax.parser import HTMLParser as _FastHTMLParser
+    except ImportError:
+        _FastHTMLParser = None
 
 BABYPIPS_URL_TEMPLATE = (
     "https://www.babypips.com/news/"
@@ -27,6 +37,11 @@ FOREX_PAIR_PATTERN = re.compile(
     + '|'.join(FOREX_CURRENCIES) + r')\b',
     re.IGNORECASE,
 )
+# Sentences (up to the next period) mentioning each currency
+_CURRENCY_SENTENCE_PATTERNS = {
+    curr: re.compile(r'[^.]*\b' + curr + r'\b[^.]*\.', re.I)
+    for curr in FOREX_CURRENCIES
+}
 
 _STANDARD_PAIRS = {
     "EURUSD", "GBPUSD", "AUDUSD", "NZDUSD",
@@ -67,6 +82,90 @@ def _normalize_pair(base, quote):
     return pair
 
 
+# Every ordered combination of distinct currencies → canonical pair
+_PAIR_TABLE = {
+    (base, quote): _normalize_pair(base, quote)
+    for base in FOREX_CURRENCIES for quote in FOREX_CURRENCIES
+    if base != quote
+}
+
+
+def extract_pairs(content):
+    """Return sorted canonical forex pairs mentioned in content."""
+    pairs = set()
+    for base, quote in FOREX_PAIR_PATTERN.findall(content):
+        pair = _PAIR_TABLE.get((base.upper(), quote.upper()))
+        if pair:
+            pairs.add(pair)
+    return sorted(pairs)
+
+
+def _first_sentences(content, limit):
+    r"""Return the first `limit` sentences of whitespace-collapsed text.
+
+    Same result as re.split(r'(?<=[.!?])\s+', content)[:limit] on
+    single-space-separated text, but only scans as far as it needs to.
+    """
+    sentences = []
+    start = 0
+    next_cut = {sep: content.find(sep) for sep in (". ", "! ", "? ")}
+    while len(sentences) < limit:
+        for sep, i in next_cut.items():
+            if 0 <= i < start:
+                next_cut[sep] = content.find(sep, start)
+        cuts = [i for i in next_cut.values() if i >= 0]
+        if not cuts:
+            sentences.append(content[start:])
+            break
+        cut = min(cuts) + 1
+        sentences.append(content[start:cut])
+        start = cut + 1
+    return sentences
+
+
+def _decoded_chunks(resp, charset):
+    """Yield the size-capped response body as decoded text pieces."""
+    decoder = codecs.getincrementaldecoder(charset)()
+    for chunk in iter_response_chunks(resp):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+
+def _extract_recap_text(html_chunks, max_words=3000):
+    """Extract article text from a recap page given as text pieces.
+
+    Uses the selectolax C parser when installed, falling back to the
+    pure-Python ContentExtractor, which is fed piece by piece as the
+    page arrives. Both skip the same boilerplate tags and prefer
+    <article>/article-class content over the full page.
+    """
+    if _FastHTMLParser is None:
+        parser = ContentExtractor()
+        # HTMLParser emits whatever text ends a feed, so a word split
+        # across pieces would come out as two; feed only up to the last
+        # "<", where any text run before it is complete
+        pending = ""
+        for piece in html_chunks:
+            pending += piece
+            cut = pending.rfind("<")
+            if cut > 0:
+                parser.feed(pending[:cut])
+                pending = pending[cut:]
+        parser.feed(pending)
+        parser.close()
+        return parser.get_content(max_words=max_words)
+
+    tree = _FastHTMLParser("".join(html_chunks))
+    tree.strip_tags(list(ContentExtractor.SKIP_TAGS))
+    node = (tree.css_first("article")
+            or tree.css_first('div[class*="article"]')
+            or tree.body)
+    if node is None:
+        return ""
+    words = node.text(separator=" ", strip=True).split()
+    return " ".join(words[:max_words])
+
+
 def fetch_babypips_recap(today):
     """Fetch BabyPips daily forex recap.
 
@@ -94,11 +193,8 @@ def fetch_babypips_recap(today):
             })
             with urllib.request.urlopen(req, timeout=30) as resp:
                 charset = resp.headers.get_content_charset() or "utf-8"
-                html = resp.read(MAX_RESPONSE_BYTES).decode(charset)
-
-            parser = ContentExtractor()
-            parser.feed(html)
-            content = parser.get_content(max_words=3000)
+                content = _extract_recap_text(
+                    _decoded_chunks(resp, charset), max_words=3000)
 
             if len(content.split()) < 50:
                 continue
@@ -114,20 +210,12 @@ def fetch_babypips_recap(today):
             result["fetch_date"] = try_date.isoformat()
 
             # Extract forex pair mentions
-            pairs = set()
-            for m in FOREX_PAIR_PATTERN.finditer(content):
-                base = m.group(1).upper()
-                quote = m.group(2).upper()
-                if base != quote:
-                    pairs.add(_normalize_pair(base, quote))
-            result["pairs_mentioned"] = sorted(pairs)
+            result["pairs_mentioned"] = extract_pairs(content)
 
             # Currency strength from directional language
             currency_bull = {}
             currency_bear = {}
-            for curr in FOREX_CURRENCIES:
-                curr_pat = re.compile(
-                    r'[^.]*\b' + curr + r'\b[^.]*\.', re.I)
+            for curr, curr_pat in _CURRENCY_SENTENCE_PATTERNS.items():
                 for sentence in curr_pat.findall(content):
                     if DIRECTIONAL_BULLISH.search(sentence):
                         currency_bull[curr] = \
@@ -137,7 +225,7 @@ def fetch_babypips_recap(today):
                             currency_bear.get(curr, 0) + 1
 
             net_strength = {}
-            for curr in set(list(currency_bull) + list(currency_bear)):
+            for curr in currency_bull.keys() | currency_bear.keys():
                 net_strength[curr] = (currency_bull.get(curr, 0)
                                       - currency_bear.get(curr, 0))
             if net_strength:
@@ -157,10 +245,9 @@ def fetch_babypips_recap(today):
             result["economic_events"] = sorted(events)
 
             # Key headlines: first substantive sentences
-            sentences = re.split(r'(?<=[.!?])\s+', content)
             result["key_headlines"] = [
                 sanitize_field(s, max_len=200)
-                for s in sentences[:5] if len(s) > 20
+                for s in _first_sentences(content, 5) if len(s) > 20
             ]
 
             print(f"  BabyPips: fetched recap for "
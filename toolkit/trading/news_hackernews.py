@@ -5,15 +5,21 @@ Fetches top HN stories and filters for AI/tech/market relevance,
 matching against watchlist symbols.
 """
 
-import json
 import re
 import sys
 import time
 import urllib.request
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 sys.path.insert(0, "/app/toolkit/cron-helpers")
 from content_security import detect_suspicious, sanitize_field
-from news_matching import match_symbols
+from news_matching import (
+    compile_alternation, iter_response_chunks, match_symbols, watchlist_key,
+)
 
 HN_API_BASE = "https://hacker-news.firebaseio.com/v0"
 HN_TOP_STORIES = f"{HN_API_BASE}/topstories.json"
@@ -27,6 +33,7 @@ HN_TECH_KEYWORDS = [
     "cloud computing", "power grid", "chip", "transformer",
     "neural network", "deep learning", "inference",
 ]
+_TECH_KEYWORD_RE = compile_alternation(HN_TECH_KEYWORDS, re.IGNORECASE)
 
 
 MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # 5 MB cap
@@ -39,10 +46,14 @@ def _fetch_json(url, timeout=15):
         "Accept": "application/json",
     })
     with urllib.request.urlopen(req, timeout=timeout) as resp:
-        data = resp.read(MAX_RESPONSE_BYTES + 1)
-        if len(data) > MAX_RESPONSE_BYTES:
-            raise RuntimeError(f"Response exceeds {MAX_RESPONSE_BYTES} bytes")
-        return json.loads(data)
+        return _json_loads(
+            b"".join(iter_response_chunks(resp, MAX_RESPONSE_BYTES)))
+
+
+def _match_tech_keywords(text):
+    """Return HN_TECH_KEYWORDS found in text, in list order (one scan)."""
+    found = {m.group(1).lower() for m in _TECH_KEYWORD_RE.finditer(text)}
+    return [kw for kw in HN_TECH_KEYWORDS if kw.lower() in found]
 
 
 def fetch_hackernews(watchlist_symbols):
@@ -65,6 +76,7 @@ def fetch_hackernews(watchlist_symbols):
         print(f"  HN: FAILED ({e})", file=sys.stderr)
         return result
 
+    key = watchlist_key(watchlist_symbols)
     for story_id in story_ids:
         try:
             time.sleep(HN_ITEM_DELAY)
@@ -84,13 +96,9 @@ def fetch_hackernews(watchlist_symbols):
 
             search_text = f"{title} {url}"
 
-            matched_keywords = [
-                kw for kw in HN_TECH_KEYWORDS
-                if re.search(r'\b' + re.escape(kw) + r'\b',
-                             search_text, re.IGNORECASE)
-            ]
+            matched_keywords = _match_tech_keywords(search_text)
 
-            matched_syms = match_symbols(search_text, watchlist_symbols)
+            matched_syms = match_symbols(search_text, key)
 
             if matched_keywords or matched_syms:
                 result["matched"].append({
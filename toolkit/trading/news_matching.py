@@ -6,6 +6,7 @@ and the market_news_supplementary orchestrator.
 """
 
 import re
+from functools import lru_cache
 
 # ── Symbol name mappings ─────────────────────────────────────────────
 
@@ -62,7 +63,13 @@ BEARISH_WORDS = [
     "lower",
 ]
 
+_BULL_RE = re.compile(
+    r'\b(' + '|'.join(BULLISH_WORDS) + r')\b', re.IGNORECASE)
+_BEAR_RE = re.compile(
+    r'\b(' + '|'.join(BEARISH_WORDS) + r')\b', re.IGNORECASE)
+
 MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # 5MB cap on HTTP responses
+READ_CHUNK_BYTES = 64 * 1024
 
 _HEADERS = {
     "User-Agent": (
@@ -73,6 +80,24 @@ _HEADERS = {
 }
 
 
+def iter_response_chunks(resp, limit=MAX_RESPONSE_BYTES,
+                         chunk_size=READ_CHUNK_BYTES):
+    """Yield an HTTP response body in chunks, enforcing a hard size cap.
+
+    Raises RuntimeError as soon as more than `limit` bytes have arrived,
+    so oversized responses are never buffered in full.
+    """
+    total = 0
+    while True:
+        chunk = resp.read(chunk_size)
+        if not chunk:
+            return
+        total += len(chunk)
+        if total > limit:
+            raise RuntimeError(f"Response exceeds {limit} bytes")
+        yield chunk
+
+
 def build_symbol_set(watchlist):
     """Build set of all tracked symbols from watchlist."""
     symbols = set()
@@ -82,35 +107,73 @@ def build_symbol_set(watchlist):
     return symbols
 
 
-def match_symbols(text, watchlist_symbols):
-    """Match text against watchlist symbols and their aliases.
+def watchlist_key(watchlist_symbols):
+    """Return a hashable, order-independent key for a symbol collection.
 
-    Returns sorted list of matched symbol strings.
+    Compute once per fetch and pass to match_symbols in per-article loops.
     """
-    if not text:
-        return []
-    matched = set()
+    return tuple(sorted(watchlist_symbols))
 
-    for symbol in watchlist_symbols:
-        aliases = SYMBOL_NAMES.get(symbol, [])
 
+def compile_alternation(terms, flags=0):
+    """Compile terms into one overlapping, word-bounded alternation.
+
+    The lookahead lets finditer report a match at every start position,
+    so one hit can't swallow an adjacent alias (e.g. "pound dollar yen").
+    Longest terms go first so the most specific alias wins a position.
+    """
+    if not terms:
+        return None
+    alts = "|".join(re.escape(t)
+                    for t in sorted(terms, key=len, reverse=True))
+    return re.compile(r'(?=\b(' + alts + r')\b)', flags)
+
+
+@lru_cache(maxsize=8)
+def _build_matcher(key):
+    """Build the regex bundle for a watchlist key.
+
+    Returns (case_sensitive_re, case_insensitive_re, exact_map, folded_map)
+    where the maps take matched text to the set of symbols it implies.
+    """
+    exact = {}
+    folded = {}
+    for symbol in key:
         # Some tickers are too ambiguous to match bare (e.g. "AI")
         if symbol not in _ALIAS_ONLY_SYMBOLS:
             if symbol in _CASE_SENSITIVE_SYMBOLS:
-                if re.search(r'\b' + re.escape(symbol) + r'\b', text):
-                    matched.add(symbol)
-                    continue
+                exact.setdefault(symbol, set()).add(symbol)
             else:
-                if re.search(r'\b' + re.escape(symbol) + r'\b', text,
-                             re.IGNORECASE):
-                    matched.add(symbol)
-                    continue
+                folded.setdefault(symbol.casefold(), set()).add(symbol)
+        for alias in SYMBOL_NAMES.get(symbol, []):
+            folded.setdefault(alias.casefold(), set()).add(symbol)
+    return (compile_alternation(exact),
+            compile_alternation(folded, re.IGNORECASE),
+            exact, folded)
+
+
+def match_symbols(text, watchlist_symbols):
+    """Match text against watchlist symbols and their aliases.
 
-        for alias in aliases:
-            if re.search(r'\b' + re.escape(alias) + r'\b', text,
-                         re.IGNORECASE):
-                matched.add(symbol)
-                break
+    watchlist_symbols may be any collection; pass a watchlist_key() tuple
+    to reuse the cached matcher without re-keying on every call.
+    Returns sorted list of matched symbol strings.
+    """
+    if not text:
+        return []
+    if not isinstance(watchlist_symbols, tuple):
+        watchlist_symbols = watchlist_key(watchlist_symbols)
+    exact_re, folded_re, exact, folded = _build_matcher(watchlist_symbols)
+
+    matched = set()
+    if exact_re is not None:
+        for m in exact_re.finditer(text):
+            matched |= exact[m.group(1)]
+    if folded_re is not None:
+        for m in folded_re.finditer(text):
+            # IGNORECASE also matches variants like "ſ" (long s) that
+            # only casefold() maps back, and a few ("ı") that nothing does
+            matched.update(folded.get(m.group(1).casefold(), ()))
 
     return sorted(matched)
 
@@ -122,11 +185,9 @@ def headline_sentiment(text):
     """
     if not text:
         return "neutral"
-    text_lower = text.lower()
-    bull = sum(1 for w in BULLISH_WORDS
-               if re.search(r'\b' + w + r'\b', text_lower))
-    bear = sum(1 for w in BEARISH_WORDS
-               if re.search(r'\b' + w + r'\b', text_lower))
+    # Count distinct keywords, not occurrences
+    bull = len({m.group(1).lower() for m in _BULL_RE.finditer(text)})
+    bear = len({m.group(1).lower() for m in _BEAR_RE.finditer(text)})
     if bull > bear:
         return "bullish"
     if bear > bull:
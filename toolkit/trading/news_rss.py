@@ -5,6 +5,7 @@ Fetches financial RSS feeds (Yahoo Finance, CNBC), parses XML,
 matches articles to watchlist symbols.
 """
 
+import re
 import sys
 import urllib.request
 import xml.etree.ElementTree as ET
@@ -12,7 +13,8 @@ import xml.etree.ElementTree as ET
 sys.path.insert(0, "/app/toolkit/cron-helpers")
 from content_security import detect_suspicious, sanitize_field
 from news_matching import (
-    match_symbols, headline_sentiment, _HEADERS, MAX_RESPONSE_BYTES,
+    match_symbols, headline_sentiment, watchlist_key, iter_response_chunks,
+    _HEADERS,
 )
 
 RSS_FEEDS = [
@@ -24,38 +26,70 @@ RSS_FEEDS = [
              "?partnerId=wrss01&id=19854910")},
 ]
 
+# Matched case-insensitively on the raw bytes (no upper-cased copy)
+_DTD_RE = re.compile(rb'<!(ENTITY|DOCTYPE)', re.IGNORECASE)
+
+
+def _article_from_item(item):
+    """Convert a complete <item> element to an article dict, or None."""
+    title = (item.findtext("title") or "").strip()
+    if not title:
+        return None
+    return {
+        "title": sanitize_field(title, max_len=300),
+        "link": (item.findtext("link") or "").strip(),
+        "published": (item.findtext("pubDate") or "").strip(),
+        "description": sanitize_field(
+            (item.findtext("description") or "").strip(), max_len=500),
+    }
 
-def parse_rss_xml(xml_bytes):
-    """Parse RSS 2.0 XML bytes into article dicts.
 
+def parse_rss_stream(chunks):
+    """Incrementally parse RSS 2.0 XML from an iterable of byte chunks.
+
+    Items in the first <channel> are converted and released as soon as
+    they close, so parsing overlaps the network read.
     Returns list of {title, link, published, description}.
     Raises ValueError if XML contains DTD entity definitions (XXE guard).
     """
-    xml_upper = xml_bytes.upper()
-    if b'<!ENTITY' in xml_upper or b'<!DOCTYPE' in xml_upper:
-        raise ValueError("RSS feed contains DTD/entity definitions")
-    root = ET.fromstring(xml_bytes)
+    parser = ET.XMLPullParser(events=("start", "end"))
     articles = []
-
-    channel = root.find("channel")
-    if channel is None:
-        return articles
-
-    for item in channel.findall("item"):
-        title = (item.findtext("title") or "").strip()
-        if not title:
-            continue
-        articles.append({
-            "title": sanitize_field(title, max_len=300),
-            "link": (item.findtext("link") or "").strip(),
-            "published": (item.findtext("pubDate") or "").strip(),
-            "description": sanitize_field(
-                (item.findtext("description") or "").strip(), max_len=500),
-        })
+    path = []
+    channels_seen = 0
+    tail = b""
+
+    for chunk in chunks:
+        # Carry a short tail so a declaration split across chunks is seen
+        if _DTD_RE.search(tail + chunk):
+            raise ValueError("RSS feed contains DTD/entity definitions")
+        tail = chunk[-16:]
+        parser.feed(chunk)
+        for event, elem in parser.read_events():
+            if event == "start":
+                path.append(elem.tag)
+                if path[1:] == ["channel"]:
+                    channels_seen += 1
+                continue
+            if path[1:] == ["channel", "item"] and channels_seen == 1:
+                article = _article_from_item(elem)
+                if article:
+                    articles.append(article)
+                elem.clear()
+            path.pop()
+    parser.close()
 
     return articles
 
 
+def parse_rss_xml(xml_bytes):
+    """Parse RSS 2.0 XML bytes into article dicts.
+
+    Returns list of {title, link, published, description}.
+    Raises ValueError if XML contains DTD entity definitions (XXE guard).
+    """
+    return parse_rss_stream([xml_bytes])
+
+
 def fetch_rss(url, timeout=30):
     """Fetch and parse an RSS feed. Returns list of article dicts."""
     req = urllib.request.Request(url, headers={
@@ -63,8 +97,7 @@ def fetch_rss(url, timeout=30):
         "Accept": "application/rss+xml, application/xml, text/xml",
     })
     with urllib.request.urlopen(req, timeout=timeout) as resp:
-        xml_bytes = resp.read(MAX_RESPONSE_BYTES)
-    return parse_rss_xml(xml_bytes)
+        return parse_rss_stream(iter_response_chunks(resp))
 
 
 def fetch_all_rss(watchlist_symbols):
@@ -81,6 +114,7 @@ def fetch_all_rss(watchlist_symbols):
         "matched": [],
         "errors": [],
     }
+    key = watchlist_key(watchlist_symbols)
 
     for feed in RSS_FEEDS:
         try:
@@ -92,7 +126,7 @@ def fetch_all_rss(watchlist_symbols):
                 search_text = f"{article['title']} {article['description']}"
                 if detect_suspicious(search_text):
                     continue
-                symbols = match_symbols(search_text, watchlist_symbols)
+                symbols = match_symbols(search_text, key)
                 if symbols:
                     sentiment = headline_sentiment(search_text)
                     result["matched"].append({
@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """Tests for market_news_supplementary.py — pure functions only, no network."""
 
+import io
 import os
 import sys
 import unittest
+from unittest.mock import patch
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -18,6 +20,12 @@ from market_news_supplementary import (
     _normalize_pair,
     _escape_pipe,
 )
+import news_babypips
+from news_babypips import (
+    _extract_recap_text, _first_sentences, extract_pairs,
+)
+from news_matching import iter_response_chunks, watchlist_key
+from news_rss import parse_rss_stream
 
 
 # -- Mock data -----------------------------------------------------------
@@ -148,6 +156,12 @@ class TestMatchSymbols(unittest.TestCase):
             "USDJPY falls on BOJ news", MOCK_SYMBOLS)
         self.assertIn("USDJPY", result)
 
+    def test_unicode_case_variants_do_not_crash(self):
+        """IGNORECASE matches long s / Kelvin sign; lookups must not KeyError."""
+        self.assertIn("SNOW", match_symbols("\u017fnowflake beats", {"SNOW", "MSFT"}))
+        self.assertIn("MSFT", match_symbols("Micro\u017foft rallies", {"SNOW", "MSFT"}))
+        self.assertEqual(match_symbols("M\u0131crosoft rallies", {"MSFT"}), [])
+
     def test_no_false_positive_ai_lowercase(self):
         """Lowercase 'ai' in common words should NOT match AI ticker."""
         result = match_symbols(
@@ -202,6 +216,16 @@ class TestMatchSymbols(unittest.TestCase):
             "Salesforce beats earnings expectations", MOCK_SYMBOLS)
         self.assertIn("CRM", result)
 
+    def test_adjacent_aliases_both_match(self):
+        result = match_symbols("euro dollar yen slides", MOCK_SYMBOLS)
+        self.assertEqual(result, ["EURUSD", "USDJPY"])
+
+    def test_watchlist_key_matches_set(self):
+        text = "Apple and Nvidia lead tech rally"
+        self.assertEqual(
+            match_symbols(text, watchlist_key(MOCK_SYMBOLS)),
+            match_symbols(text, MOCK_SYMBOLS))
+
 
 class TestHeadlineSentiment(unittest.TestCase):
     def test_bullish(self):
@@ -453,6 +477,64 @@ class TestNormalizePair(unittest.TestCase):
         self.assertEqual(_normalize_pair("XYZ", "ABC"), "XYZABC")
 
 
+class TestExtractRecapText(unittest.TestCase):
+    HTML = (
+        "<html><body><nav>Menu Login</nav>"
+        "<article><p>EUR/USD rallied after the ECB decision.</p>"
+        "<script>var x = 1;</script><p>GBP was weak.</p></article>"
+        "<footer>Copyright</footer></body></html>"
+    )
+
+    def test_prefers_article_and_skips_boilerplate(self):
+        text = _extract_recap_text([self.HTML])
+        self.assertIn("EUR/USD rallied", text)
+        self.assertIn("GBP was weak.", text)
+        self.assertNotIn("Menu", text)
+        self.assertNotIn("var x", text)
+        self.assertNotIn("Copyright", text)
+
+    def test_word_limit(self):
+        text = _extract_recap_text([self.HTML], max_words=3)
+        self.assertEqual(len(text.split()), 3)
+
+    @unittest.skipUnless(news_babypips._FastHTMLParser, "selectolax not installed")
+    def test_selectolax_matches_fallback_on_chunked_input(self):
+        chunks = [self.HTML[i:i + 17] for i in range(0, len(self.HTML), 17)]
+        fast = _extract_recap_text(chunks)
+        with patch("news_babypips._FastHTMLParser", None):
+            fallback = _extract_recap_text(chunks)
+        self.assertEqual(fast, fallback)
+        self.assertIn("EUR/USD rallied", fast)
+
+
+class TestExtractPairs(unittest.TestCase):
+    def test_separators_and_case(self):
+        text = "EUR/USD rose, usd jpy fell and GBPUSD held."
+        self.assertEqual(extract_pairs(text),
+                         ["EURUSD", "GBPUSD", "USDJPY"])
+
+    def test_flipped_pair_normalized(self):
+        self.assertEqual(extract_pairs("JPY/GBP slid"), ["GBPJPY"])
+
+    def test_same_currency_ignored(self):
+        self.assertEqual(extract_pairs("USD USD strength"), [])
+
+
+class TestFirstSentences(unittest.TestCase):
+    def test_splits_on_terminators(self):
+        text = "Dollar rallied. Yen slid! Will it last? More later."
+        self.assertEqual(_first_sentences(text, 3),
+                         ["Dollar rallied.", "Yen slid!", "Will it last?"])
+
+    def test_remainder_when_short(self):
+        self.assertEqual(_first_sentences("No terminator here", 5),
+                         ["No terminator here"])
+
+    def test_decimal_point_not_split(self):
+        self.assertEqual(_first_sentences("EUR at 1.08 today. Done.", 5),
+                         ["EUR at 1.08 today.", "Done."])
+
+
 class TestEscapePipe(unittest.TestCase):
     def test_escapes_pipe(self):
         self.assertEqual(
@@ -476,6 +558,32 @@ class TestBuildSymbolSet(unittest.TestCase):
         self.assertEqual(build_symbol_set({}), set())
 
 
+class TestParseRssStream(unittest.TestCase):
+    def test_chunked_matches_whole(self):
+        chunks = [MOCK_RSS_XML[i:i + 50]
+                  for i in range(0, len(MOCK_RSS_XML), 50)]
+        self.assertEqual(parse_rss_stream(chunks),
+                         parse_rss_xml(MOCK_RSS_XML))
+
+    def test_rejects_doctype_split_across_chunks(self):
+        chunks = [b'<?xml version="1.0"?><!DOC', b'TYPE rss><rss/>']
+        with self.assertRaises(ValueError):
+            parse_rss_stream(chunks)
+
+
+class TestIterResponseChunks(unittest.TestCase):
+    def test_yields_whole_body(self):
+        body = b"x" * 1000
+        chunks = list(iter_response_chunks(
+            io.BytesIO(body), limit=1000, chunk_size=64))
+        self.assertEqual(b"".join(chunks), body)
+
+    def test_raises_over_limit(self):
+        with self.assertRaises(RuntimeError):
+            list(iter_response_chunks(
+                io.BytesIO(b"x" * 1001), limit=1000, chunk_size=64))
+
+
 class TestParseRssXmlSecurity(unittest.TestCase):
     def test_rejects_dtd_entity(self):
         xml = b"""<?xml version="1.0"?>
@@ -491,6 +599,13 @@ class TestParseRssXmlSecurity(unittest.TestCase):
         with self.assertRaises(ValueError):
             parse_rss_xml(xml)
 
+    def test_rejects_lowercase_doctype(self):
+        xml = b"""<?xml version="1.0"?>
+        <!doctype rss SYSTEM "http://evil.com/dtd">
+        <rss><channel></channel></rss>"""
+        with self.assertRaises(ValueError):
+            parse_rss_xml(xml)
+
 
 class TestMatchSymbolsFalsePositives(unittest.TestCase):
     def test_path_lowercase_no_match(self):
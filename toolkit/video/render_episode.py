@@ -112,16 +112,17 @@ def render_composition(composition_id: str, props: dict, output_path: str) -> bo
 
 
 def _map_bullet_timings(
-    section, narration_text: str, timing_path: str, duration_sec: float,
+    bullet_offsets: list[int], narration_text: str, timing_path: str,
+    duration_sec: float,
 ) -> list[int]:
     """Map bullet appearance frames from TTS timing data.
 
+    bullet_offsets are where each bullet starts in narration_text (see
+    parse_episode.narration_and_offsets).
+
     Supports both SentenceBoundary (edge_tts v7+) and WordBoundary events.
     Falls back to evenly-spaced timing if no data is available.
     """
-    from parse_episode import get_bullet_char_offsets
-
-    bullet_offsets = get_bullet_char_offsets(section)
     if not bullet_offsets:
         return []
 
@@ -294,7 +295,7 @@ def main():
 
     # Import parse_episode from cron-helpers (shared lib)
     sys.path.insert(0, "/app/toolkit/cron-helpers")
-    from parse_episode import Episode, bullets_to_narration, parse_bullet_parts, get_bullet_char_offsets, parse_episode, get_next_episode, is_last_in_series
+    from parse_episode import Episode, narration_and_offsets, parse_bullet_parts, parse_episode, get_next_episode, is_last_in_series
 
     # Resolve episode
     if args.episode_from_schedule:
@@ -415,7 +416,7 @@ def main():
             logger.info(f"\n[{section.number}/{total_sections}] {section.title} ({section.time_min} min) ...")
 
             # Generate narration with word-boundary timing
-            narration_text = bullets_to_narration(section)
+            narration_text, bullet_offsets = narration_and_offsets(section)
             audio_filename = f"section_{section.number}_{timestamp}.mp3"
             audio_path = os.path.join(AUDIO_DIR, audio_filename)
             timing_path = os.path.join(tmpdir, f"timing_{section.number}.json")
@@ -437,7 +438,7 @@ def main():
 
             # Map bullet timings from word boundaries
             bullet_timings = _map_bullet_timings(
-                section, narration_text, timing_path, duration_sec,
+                bullet_offsets, narration_text, timing_path, duration_sec,
             )
             logger.debug(f"  Bullet timings: {bullet_timings[:4]}{'...' if len(bullet_timings) > 4 else ''}")
 